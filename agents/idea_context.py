@@ -5,7 +5,7 @@ Gibt einen strukturierten Markdown-Text zurück, der beschreibt, welche
 vorhandenen Daten zur eingereichten Idee passen.
 """
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from config import OPENAI_MODEL
 
 
@@ -23,13 +23,47 @@ def run(
     Returns:
         Strukturierter Markdown-Text mit relevanten Signalen.
     """
+    prompt = _build_prompt(idea_title, idea_desc, rss_articles, ga4_pages, gsc_queries)
+    response = client.chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.3,
+    )
+    return response.choices[0].message.content
+
+
+async def arun(
+    client: AsyncOpenAI,
+    idea_title: str,
+    idea_desc: str,
+    rss_articles: list[dict],
+    ga4_pages: list[dict],
+    gsc_queries: list[dict],
+) -> str:
+    """Async-Variante von run() für den AsyncOpenAI-Client."""
+    prompt = _build_prompt(idea_title, idea_desc, rss_articles, ga4_pages, gsc_queries)
+    response = await client.chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.3,
+    )
+    return response.choices[0].message.content
+
+
+def _build_prompt(
+    idea_title: str,
+    idea_desc: str,
+    rss_articles: list[dict],
+    ga4_pages: list[dict],
+    gsc_queries: list[dict],
+) -> str:
     rss_text = _format_rss(rss_articles)
     ga4_text = _format_ga4(ga4_pages)
     gsc_text = _format_gsc(gsc_queries)
 
     desc_section = f"\n**Beschreibung:** {idea_desc.strip()}" if idea_desc.strip() else ""
 
-    prompt = f"""Du bist ein Daten-Rechercheur für ein deutschsprachiges Wirtschaftsmedium.
+    return f"""Du bist ein Daten-Rechercheur für ein deutschsprachiges Wirtschaftsmedium.
 
 Ein Redakteur hat folgende Artikel-Idee eingereicht:
 
@@ -73,13 +107,6 @@ Falls keine Überschneidung, schreibe "Kein direktes GSC-Signal."
 
 Antworte auf Deutsch. Sei präzise und faktenbasiert."""
 
-    response = client.chat.completions.create(
-        model=OPENAI_MODEL,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.3,
-    )
-    return response.choices[0].message.content
-
 
 def _format_rss(articles: list[dict]) -> str:
     if not articles:
@@ -12,7 +12,7 @@ Verdict: ≥ 70 → "Empfohlen", 45–69 → "Mit Vorbehalt", < 45 → "Nicht em
 """
 
 import json
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from config import OPENAI_MODEL
 
 
@@ -29,9 +29,32 @@ def run(client: OpenAI, idea_title: str, idea_desc: str, context: str) -> dict:
             "recommendation":  "2-3 Sätze Handlungsempfehlung",
         }
     """
+    prompt = _build_prompt(idea_title, idea_desc, context)
+    response = client.chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.3,
+        response_format={"type": "json_object"},
+    )
+    return _parse_response(response.choices[0].message.content)
+
+
+async def arun(client: AsyncOpenAI, idea_title: str, idea_desc: str, context: str) -> dict:
+    """Async-Variante von run() für den AsyncOpenAI-Client."""
+    prompt = _build_prompt(idea_title, idea_desc, context)
+    response = await client.chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.3,
+        response_format={"type": "json_object"},
+    )
+    return _parse_response(response.choices[0].message.content)
+
+
+def _build_prompt(idea_title: str, idea_desc: str, context: str) -> str:
     desc_section = f"\n**Beschreibung:** {idea_desc.strip()}" if idea_desc.strip() else ""
 
-    prompt = f"""Du bist ein erfahrener Chefredakteur eines deutschsprachigen Wirtschaftsmediums.
+    return f"""Du bist ein erfahrener Chefredakteur eines deutschsprachigen Wirtschaftsmediums.
 
 Bewerte die folgende Artikel-Idee anhand der vorliegenden Datenlage.
 
@@ -77,14 +100,8 @@ Wichtig:
 - "recommendation": praxisnah, was der Redakteur als nächstes tun soll
 - Antworte ausschliesslich mit dem JSON-Objekt, ohne Erklärungen davor oder danach"""
 
-    response = client.chat.completions.create(
-        model=OPENAI_MODEL,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.3,
-        response_format={"type": "json_object"},
-    )
 
-    raw = response.choices[0].message.content
+def _parse_response(raw: str) -> dict:
     data = json.loads(raw)
 
     # Normalize and validate output
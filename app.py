@@ -9,6 +9,7 @@ Zeigt 10 KI-generierte Content-Ideen basierend auf:
 Zusätzlich: Vollständige Artikel per "✍️ Artikel erstellen"-Button generieren.
 """
 
+import contextlib
 import json
 import os
 
@@ -55,7 +56,7 @@ def _check_connections() -> dict:
     try:
         if not property_id:
             raise ValueError("GA4_PROPERTY_ID nicht gesetzt")
-        fetch_top_pages(property_id, creds_file, days_back=7, limit=1)
+        fetch_top_pages(property_id, creds_file, days_back=7, limit=1, force_refresh=True)
         ga4_ok = True
     except Exception as e:
         ga4_ok = False
@@ -65,7 +66,7 @@ def _check_connections() -> dict:
     try:
         if not site_url:
             raise ValueError("GSC_SITE_URL nicht gesetzt")
-        fetch_top_queries(site_url, creds_file, days_back=7, limit=1)
+        fetch_top_queries(site_url, creds_file, days_back=7, limit=1, force_refresh=True)
         gsc_ok = True
     except Exception as e:
         gsc_ok = False
@@ -156,6 +157,11 @@ with st.sidebar:
     st.divider()
 
     show_details = st.checkbox("Agent-Outputs anzeigen", value=False)
+    force_refresh = st.checkbox(
+        "Daten neu abrufen",
+        value=False,
+        help="GA4, Search Console, RSS und Trends frisch laden statt aus dem Cache.",
+    )
 
     # ── Gemerkte Ideen ───────────────────────────────────────────────────────
     _bookmarks = st.session_state.get("bookmarks", {})
@@ -245,8 +251,24 @@ if generate:
             display_text = accumulated_text
         content_placeholder.markdown(f"**{label}**\n\n{display_text}")
 
-    result = pipeline.run(status_callback=on_status, token_callback=on_token)
-    st.session_state.pipeline_result = result
+    # Render pipeline events as they arrive instead of waiting for the full run
+    show_live_output = True
+    # closing(): a rerun/stop leaves this loop via an exception — close the
+    # stream right away so the background run is cancelled, not finished unseen
+    with contextlib.closing(pipeline.stream(force_refresh=force_refresh)) as events:
+        for event in events:
+            if event["event"] == "status":
+                on_status(event["message"])
+            elif event["event"] == "token":
+                if show_live_output:
+                    try:
+                        on_token(event["phase"], event["text"])
+                    except Exception as e:
+                        # A broken live view must not cost us the run's result
+                        print(f"[app] Live-Output Fehler: {e}")
+                        show_live_output = False
+            else:
+                st.session_state.pipeline_result = event["result"]
 
     log_area.empty()  # removes the entire container once ideas are ready
 
@@ -570,12 +592,23 @@ if result is not None:
 st.divider()
 st.subheader("💭 Eigene Idee prüfen")
 
+def _prefetch_idea_feeds():
+    """Feeds für den eingegebenen Titel schon vor dem Klick auf «Prüfen» laden."""
+    _title = st.session_state.get("user_idea_title", "")
+    if _title.strip():
+        evaluation_pipeline.prefetch(
+            _title, include_rss=st.session_state.pipeline_result is None
+        )
+
+
 col_input, col_btn = st.columns([4, 1])
 with col_input:
     user_idea_title = st.text_input(
         "Ideen-Titel",
         placeholder="z.B. Warum der Franken 2025 unter Druck gerät",
         label_visibility="collapsed",
+        key="user_idea_title",
+        on_change=_prefetch_idea_feeds,
     )
 user_idea_desc = st.text_area(
     "Beschreibung (optional)",
@@ -60,6 +60,15 @@ TRENDS_KEYWORDS = [
 # Max RSS items to fetch per feed (before filtering)
 RSS_MAX_ITEMS_PER_FEED = 15
 
+# Disk cache lifetimes for data fetches in seconds (see data/cache.py)
+CACHE_TTL_ANALYTICS = 6 * 60 * 60   # GA4 + GSC, ändern sich höchstens täglich
+CACHE_TTL_TRENDS = 6 * 60 * 60      # Google Trends (7-Tage-Index, ändert sich über Stunden)
+CACHE_TTL_RSS = 15 * 60             # RSS-Feeds, News sollen frisch bleiben
+
+# Live token updates: forward at most every N new characters or T seconds
+TOKEN_BATCH_CHARS = 16
+TOKEN_BATCH_INTERVAL = 0.03
+
 # OpenAI model used by all agents
 OPENAI_MODEL = "gpt-5.2"
 OPENAI_MODEL_PRO = OPENAI_MODEL
@@ -123,7 +123,7 @@ def run(
             result.errors.append(f"Fact-Checker-Fehler ({loop_label}): {e}")
             # Continue with unchecked article rather than aborting
 
-        # Evaluator
+        # Evaluator — scores the fact-checked text the user will actually see
         status(f"Evaluator: Artikel wird bewertet ({loop_label})...")
         try:
             evaluation = evaluator_agent.run(client, article, idea)
@@ -0,0 +1,85 @@
+"""
+On-disk TTL cache for the data fetchers (GA4, GSC, Google Trends, RSS).
+
+Results are pickled to data/_cache/, keyed by a SHA-256 of the function name
+and its arguments, so repeated pipeline runs skip the network round-trips
+while the data is still fresh. Decorated functions accept an extra
+force_refresh=True keyword that bypasses the cache and stores a new result,
+and expose .cached(*args, **kwargs), which returns a fresh entry or None
+without ever calling the function.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+_CACHE_DIR = Path(__file__).parent / "_cache"
+
+
+def _cache_path(func, signature: inspect.Signature, args: tuple, kwargs: dict) -> Path:
+    # Bind to the signature so f(x, 5), f(x, limit=5) and f(x) with limit=5 as
+    # default all map to the same entry
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    raw = repr((func.__module__, func.__qualname__, tuple(bound.arguments.items())))
+    return _CACHE_DIR / f"{hashlib.sha256(raw.encode('utf-8')).hexdigest()}.pkl"
+
+
+def _read_fresh(path: Path, ttl_seconds: int):
+    """Return the cached data at `path` if younger than `ttl_seconds`, else None."""
+    try:
+        with path.open("rb") as f:
+            stored_at, data = pickle.load(f)
+    except Exception:
+        return None  # Missing or unreadable entry
+    return data if time.time() - stored_at < ttl_seconds else None
+
+
+def ttl_cache(ttl_seconds: int, should_cache=bool):
+    """
+    Cache a function's return value on disk for `ttl_seconds`.
+
+    `should_cache(result)` decides whether a result is stored; the default
+    skips empty results, which usually stand for a swallowed fetch error.
+    Functions returning several lists should pass e.g. `any`, since a
+    container of empty lists is truthy.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, force_refresh: bool = False, **kwargs):
+            path = _cache_path(func, signature, args, kwargs)
+            if not force_refresh:
+                data = _read_fresh(path, ttl_seconds)
+                if data is not None:
+                    return data
+
+            data = func(*args, **kwargs)
+            if should_cache(data):
+                try:
+                    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    # Write to a temp file first so concurrent readers never see half an entry
+                    fd, tmp = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+                    with os.fdopen(fd, "wb") as f:
+                        pickle.dump((time.time(), data), f, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(tmp, path)
+                except Exception:
+                    pass  # Cache is non-critical
+            return data
+
+        def cached(*args, **kwargs):
+            return _read_fresh(_cache_path(func, signature, args, kwargs), ttl_seconds)
+
+        wrapper.cached = cached
+        return wrapper
+
+    return decorator
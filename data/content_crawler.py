@@ -9,14 +9,19 @@ no extra dependencies needed.
 """
 
 import re
+import threading
 import time
+from collections import OrderedDict
 from html.parser import HTMLParser
 from urllib.parse import urljoin, urlparse
 
 import requests
 
-# Simple in-memory cache: url → result dict
-_CACHE: dict[str, dict] = {}
+# In-memory LRU cache with TTL: url → (stored_at, result dict)
+_CACHE_MAXSIZE = 512
+_CACHE_TTL = 3600  # seconds
+_CACHE: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_CACHE_LOCK = threading.Lock()
 
 _HEADERS = {
     "User-Agent": (
@@ -27,6 +32,16 @@ _HEADERS = {
 
 _REQUEST_TIMEOUT = 8  # seconds per page
 
+_MAX_BODY_BYTES = 512 * 1024  # only the first 512 KB of a page are parsed
+
+_MAX_CONTENT_LENGTH = 2_000_000  # skip pages announcing more than ~2 MB
+
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Shared session: keeps connections to the same host alive between pages
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+
 
 class _TextExtractor(HTMLParser):
     """Strips HTML tags and collects visible text."""
@@ -47,10 +62,10 @@ class _TextExtractor(HTMLParser):
             self._skip -= 1
 
     def handle_data(self, data):
-        if not self._skip:
-            text = data.strip()
-            if text:
-                self.chunks.append(text)
+        # Whitespace-only runs between tags are common; skip them without allocating
+        if self._skip or not data or data.isspace():
+            return
+        self.chunks.append(data.strip())
 
 
 def _extract_text(html: str) -> str:
@@ -84,12 +99,78 @@ def _extract_date(html: str) -> str:
     return ""
 
 
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
+
+
 def _summarise(text: str, max_sentences: int = 4) -> str:
     """Return the first `max_sentences` sentences of the text."""
-    sentences = re.split(r"(?<=[.!?])\s+", text.strip())
+    # maxsplit stops scanning after the last sentence we keep
+    sentences = _SENTENCE_BREAK_RE.split(text.strip(), maxsplit=max_sentences)
     return " ".join(sentences[:max_sentences])
 
 
+def _fetch_html(url: str) -> str:
+    """
+    Download at most _MAX_BODY_BYTES of an HTML page.
+
+    Only the response headers are inspected before deciding: non-HTML
+    content and oversized pages raise ValueError("skipped: ...") without
+    reading the body. Responses without a Content-Type are parsed as HTML.
+    """
+    with _SESSION.get(url, timeout=_REQUEST_TIMEOUT, stream=True) as resp:
+        resp.raise_for_status()
+        content_type = resp.headers.get("Content-Type", "")
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        if media_type and media_type not in _HTML_CONTENT_TYPES:
+            raise ValueError(f"skipped: {content_type}")
+        try:
+            content_length = int(resp.headers.get("Content-Length", "0"))
+        except ValueError:
+            content_length = 0
+        if content_length > _MAX_CONTENT_LENGTH:
+            raise ValueError(f"skipped: {content_length} Bytes")
+
+        buf = bytearray()
+        for chunk in resp.iter_content(chunk_size=8192):
+            buf += chunk
+            if len(buf) >= _MAX_BODY_BYTES:
+                break
+        try:
+            return buf.decode(resp.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return buf.decode("utf-8", errors="replace")
+
+
+def _cache_get(url: str) -> dict | None:
+    with _CACHE_LOCK:
+        entry = _CACHE.get(url)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > _CACHE_TTL:
+            del _CACHE[url]
+            return None
+        _CACHE.move_to_end(url)
+        return result
+
+
+def _cache_put(url: str, result: dict) -> None:
+    with _CACHE_LOCK:
+        _CACHE[url] = (time.monotonic(), result)
+        _CACHE.move_to_end(url)
+        while len(_CACHE) > _CACHE_MAXSIZE:
+            _CACHE.popitem(last=False)
+
+
+def invalidate(url: str | None = None) -> None:
+    """Drop `url` from the crawl cache, or the whole cache if no URL is given."""
+    with _CACHE_LOCK:
+        if url is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop(url, None)
+
+
 def crawl_page(url: str) -> dict:
     """
     Fetch a single URL and return a summary dict.
@@ -97,8 +178,9 @@ def crawl_page(url: str) -> dict:
     Returns:
         {url, title, summary, word_count, estimated_date}
     """
-    if url in _CACHE:
-        return _CACHE[url]
+    cached = _cache_get(url)
+    if cached is not None:
+        return cached
 
     result = {
         "url": url,
@@ -110,9 +192,7 @@ def crawl_page(url: str) -> dict:
     }
 
     try:
-        resp = requests.get(url, headers=_HEADERS, timeout=_REQUEST_TIMEOUT)
-        resp.raise_for_status()
-        html = resp.text
+        html = _fetch_html(url)
 
         result["title"] = _extract_title(html)
         result["estimated_date"] = _extract_date(html)
@@ -123,7 +203,7 @@ def crawl_page(url: str) -> dict:
     except Exception as exc:
         result["error"] = str(exc)
 
-    _CACHE[url] = result
+    _cache_put(url, result)
     return result
 
 
@@ -5,76 +5,59 @@ Returns top-performing pages and engagement metrics for the last N days.
 Uses a Service Account for authentication.
 """
 
-import json
-import os
 from datetime import date, timedelta
+from functools import lru_cache
+
 from google.analytics.data_v1beta import BetaAnalyticsDataClient
 from google.analytics.data_v1beta.types import (
+    BatchRunReportsRequest,
     DateRange,
     Dimension,
     Metric,
     RunReportRequest,
 )
-from google.oauth2 import service_account
-
-
-def _parse_creds_json(s: str) -> dict:
-    """Parse credentials JSON, auch wenn literale Newlines in String-Values stecken."""
-    in_string = False
-    escaped = False
-    out = []
-    for c in s:
-        if escaped:
-            out.append(c); escaped = False
-        elif c == "\\" and in_string:
-            out.append(c); escaped = True
-        elif c == '"':
-            in_string = not in_string; out.append(c)
-        elif c == "\n" and in_string:
-            out.append("\\n")
-        elif c == "\r" and in_string:
-            out.append("\\r")
-        else:
-            out.append(c)
-    return json.loads("".join(out))
+from google.api_core import exceptions as api_exceptions
+from google.api_core.retry import Retry, if_exception_type
+
+from config import CACHE_TTL_ANALYTICS
+from data.cache import ttl_cache
+from data.google_auth import load_credentials
+
+# Exponential backoff for quota (429) and transient server errors
+_RETRY = Retry(
+    predicate=if_exception_type(
+        api_exceptions.ResourceExhausted,
+        api_exceptions.ServiceUnavailable,
+        api_exceptions.InternalServerError,
+    ),
+    initial=1.0,
+    maximum=10.0,
+    multiplier=2.0,
+    timeout=30.0,
+)
 
 
 def _get_client(credentials_file: str) -> BetaAnalyticsDataClient:
-    creds_json = os.getenv("GOOGLE_CREDENTIALS_JSON")
-    # Fallback: GOOGLE_CREDENTIALS_FILE enthält direkt JSON-Inhalt (z.B. Streamlit Cloud)
-    if not creds_json and credentials_file.strip().startswith("{"):
-        creds_json = credentials_file
-    if creds_json:
-        credentials = service_account.Credentials.from_service_account_info(
-            _parse_creds_json(creds_json),
-            scopes=["https://www.googleapis.com/auth/analytics.readonly"],
-        )
-    else:
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_file,
-            scopes=["https://www.googleapis.com/auth/analytics.readonly"],
-        )
-    return BetaAnalyticsDataClient(credentials=credentials)
+    # load_credentials() is cached per credential source (file and
+    # GOOGLE_CREDENTIALS_JSON), so a changed source yields a new client
+    credentials = load_credentials(
+        credentials_file,
+        scopes=["https://www.googleapis.com/auth/analytics.readonly"],
+    )
+    return _client_for(credentials)
 
 
-def fetch_top_pages(
-    property_id: str,
-    credentials_file: str,
-    days_back: int = 7,
-    limit: int = 20,
-) -> list[dict]:
-    """
-    Fetch top pages by page views with engagement rate for the last `days_back` days.
+@lru_cache(maxsize=4)
+def _client_for(credentials) -> BetaAnalyticsDataClient:
+    # Cached: the gRPC channel (HTTP/2) is thread-safe and stays open between calls
+    return BetaAnalyticsDataClient(credentials=credentials)
 
-    Returns a list of dicts with keys:
-        page_title, page_path, page_views, engagement_rate
-    """
-    client = _get_client(credentials_file)
 
+def _top_pages_request(property_id: str, days_back: int, limit: int) -> RunReportRequest:
     end_date = date.today().isoformat()
     start_date = (date.today() - timedelta(days=days_back)).isoformat()
 
-    request = RunReportRequest(
+    return RunReportRequest(
         property=f"properties/{property_id}",
         dimensions=[
             Dimension(name="pageTitle"),
@@ -91,8 +74,8 @@ def fetch_top_pages(
         limit=limit,
     )
 
-    response = client.run_report(request)
 
+def _parse_top_pages(response) -> list[dict]:
     results = []
     for row in response.rows:
         results.append(
@@ -103,5 +86,71 @@ def fetch_top_pages(
                 "engagement_rate": round(float(row.metric_values[1].value) * 100, 1),
             }
         )
+    return results
+
+
+@ttl_cache(CACHE_TTL_ANALYTICS)
+def fetch_top_pages(
+    property_id: str,
+    credentials_file: str,
+    days_back: int = 7,
+    limit: int = 20,
+) -> list[dict]:
+    """
+    Fetch top pages by page views with engagement rate for the last `days_back` days.
+
+    Returns a list of dicts with keys:
+        page_title, page_path, page_views, engagement_rate
+    """
+    client = _get_client(credentials_file)
+    response = client.run_report(
+        _top_pages_request(property_id, days_back, limit), retry=_RETRY
+    )
+    return _parse_top_pages(response)
+
+
+# One list per period; [[], []] is truthy, and an empty period may stand for a
+# failed fallback request, so only complete results are cached
+@ttl_cache(CACHE_TTL_ANALYTICS, should_cache=all)
+def fetch_top_pages_batch(
+    property_id: str,
+    credentials_file: str,
+    days_back_list: list[int],
+    limit: int = 20,
+) -> list[list[dict]]:
+    """
+    Fetch top pages for several lookback periods in a single batchRunReports call.
+
+    GA4 accepts up to 5 reports per batch. Returns one result list per entry
+    in `days_back_list`, in the same order (same shape as fetch_top_pages()).
+    If the batch call fails, each period is requested on its own so one
+    rejected report does not cost the others; a period that still fails
+    yields an empty list, and the error is raised only if all of them fail.
+    """
+    client = _get_client(credentials_file)
+    requests = [
+        _top_pages_request(property_id, days_back, limit)
+        for days_back in days_back_list
+    ]
+    try:
+        response = client.batch_run_reports(
+            BatchRunReportsRequest(
+                property=f"properties/{property_id}", requests=requests
+            ),
+            retry=_RETRY,
+        )
+        return [_parse_top_pages(report) for report in response.reports]
+    except api_exceptions.GoogleAPIError as e:
+        print(f"[google_analytics] batchRunReports fehlgeschlagen, Einzelabfragen: {e}")
 
+    results, last_error = [], None
+    for days_back, request in zip(days_back_list, requests):
+        try:
+            results.append(_parse_top_pages(client.run_report(request, retry=_RETRY)))
+        except api_exceptions.GoogleAPIError as e:
+            print(f"[google_analytics] runReport ({days_back} Tage) fehlgeschlagen: {e}")
+            results.append([])
+            last_error = e
+    if last_error is not None and not any(results):
+        raise last_error
     return results
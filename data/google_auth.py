@@ -0,0 +1,57 @@
+"""
+Shared Service-Account authentication for the Google data fetchers (GA4, GSC).
+
+Credentials are read from GOOGLE_CREDENTIALS_JSON (hosting) or from
+GOOGLE_CREDENTIALS_FILE, which may hold either a path or the JSON itself.
+"""
+
+import os
+import re
+from functools import lru_cache
+
+import orjson
+from google.oauth2 import service_account
+
+
+# One complete JSON string literal (escape sequences included)
+_JSON_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+def _escape_newlines(match: re.Match) -> str:
+    return match.group(0).replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _parse_creds_json(s: str) -> dict:
+    """Parse credentials JSON, auch wenn literale Newlines in String-Values stecken."""
+    try:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError:
+        # Secrets UIs often turn the "\n" escapes in private_key into real newlines
+        return orjson.loads(_JSON_STRING_RE.sub(_escape_newlines, s))
+
+
+def load_credentials(credentials_file: str, scopes: list[str]) -> service_account.Credentials:
+    """Build Service-Account credentials for the given OAuth scopes."""
+    return _load_credentials(
+        credentials_file, tuple(scopes), os.getenv("GOOGLE_CREDENTIALS_JSON")
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_credentials(
+    credentials_file: str, scopes: tuple[str, ...], creds_json: str | None
+) -> service_account.Credentials:
+    # Cached: fetches share the parsed key and its access token instead of re-reading it
+
+    # Fallback: GOOGLE_CREDENTIALS_FILE enthält direkt JSON-Inhalt (z.B. Streamlit Cloud)
+    if not creds_json and credentials_file.strip().startswith("{"):
+        creds_json = credentials_file
+    if creds_json:
+        return service_account.Credentials.from_service_account_info(
+            _parse_creds_json(creds_json),
+            scopes=scopes,
+        )
+    return service_account.Credentials.from_service_account_file(
+        credentials_file,
+        scopes=scopes,
+    )
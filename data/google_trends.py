@@ -10,7 +10,12 @@ from __future__ import annotations
 
 import time
 
+from config import CACHE_TTL_TRENDS
+from data.cache import ttl_cache
 
+
+# All-zero results mean every pytrends batch failed (e.g. rate limit) — don't keep those
+@ttl_cache(CACHE_TTL_TRENDS, should_cache=lambda items: any(i["value"] for i in items))
 def fetch_trending_topics(geo: str = "CH", limit: int = 20) -> list[dict]:
     """
     Return a list of keywords ranked by current search interest in Switzerland.
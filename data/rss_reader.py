@@ -5,12 +5,29 @@ Fetches recent articles from configured news feeds.
 Uses certifi to fix SSL certificate issues on macOS.
 """
 
+import concurrent.futures
+import io
+import re
 import ssl
+import urllib.parse
 import urllib.request
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
 import certifi
 import feedparser
-from datetime import datetime, timezone
-from config import RSS_FEEDS, RSS_MAX_ITEMS_PER_FEED
+from config import CACHE_TTL_RSS, RSS_FEEDS, RSS_MAX_ITEMS_PER_FEED
+from data.cache import ttl_cache
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Namespaced RSS extensions that feedparser maps onto summary/published
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+# Sort key for articles without a publication date (sorted last)
+_MIN_DT = datetime.min.replace(tzinfo=timezone.utc)
 
 
 def _fetch_feed_raw(url: str) -> bytes:
@@ -21,6 +38,69 @@ def _fetch_feed_raw(url: str) -> bytes:
         return resp.read()
 
 
+def _parse_rss(raw: bytes, max_items: int) -> list[dict]:
+    """
+    Stream-parse a plain RSS 2.0 feed with the C-accelerated ElementTree parser.
+
+    Returns a list of dicts with keys title, summary, published, url.
+    Raises ET.ParseError on malformed XML; returns [] if the feed has no
+    <item> elements (e.g. Atom feeds).
+    """
+    items = []
+    for _event, elem in ET.iterparse(io.BytesIO(raw), events=("end",)):
+        if elem.tag != "item":
+            continue
+        items.append(
+            {
+                "title": (elem.findtext("title") or "").strip(),
+                "summary": _clean_summary(
+                    elem.findtext("description") or elem.findtext(_CONTENT_ENCODED) or ""
+                ),
+                "published": _parse_pub_date(
+                    elem.findtext("pubDate") or elem.findtext(_DC_DATE)
+                ),
+                "url": (elem.findtext("link") or "").strip(),
+            }
+        )
+        elem.clear()
+        if len(items) >= max_items:
+            break
+    return items
+
+
+def _parse_feed(raw: bytes, max_items: int) -> list[dict]:
+    """Parse RSS via _parse_rss, falling back to feedparser for Atom or malformed feeds."""
+    try:
+        items = _parse_rss(raw, max_items)
+        if items:
+            return items
+    except ET.ParseError:
+        pass
+
+    feed = feedparser.parse(raw)
+    return [
+        {
+            "title": entry.get("title", "").strip(),
+            "summary": _clean_summary(entry.get("summary", "")),
+            "published": _parse_date(entry),
+            "url": entry.get("link", ""),
+        }
+        for entry in feed.entries[:max_items]
+    ]
+
+
+def _fetch_feed_articles(feed_config: dict, max_per_feed: int) -> list[dict]:
+    """Fetch and parse one configured feed; returns [] if it cannot be loaded."""
+    try:
+        raw = _fetch_feed_raw(feed_config["url"])
+        return [{"source": feed_config["name"], **item} for item in _parse_feed(raw, max_per_feed)]
+    except Exception as e:
+        # Log but don't inject error messages as articles into the LLM prompt
+        print(f"[rss_reader] Feed '{feed_config['name']}' konnte nicht geladen werden: {e}")
+        return []
+
+
+@ttl_cache(CACHE_TTL_RSS)
 def fetch_rss_articles(feeds: list[dict] | None = None, max_per_feed: int = RSS_MAX_ITEMS_PER_FEED) -> list[dict]:
     """
     Fetch recent articles from all configured RSS feeds.
@@ -33,30 +113,13 @@ def fetch_rss_articles(feeds: list[dict] | None = None, max_per_feed: int = RSS_
 
     articles = []
 
-    for feed_config in feeds:
-        try:
-            raw = _fetch_feed_raw(feed_config["url"])
-            feed = feedparser.parse(raw)
-            for entry in feed.entries[:max_per_feed]:
-                published = _parse_date(entry)
-                articles.append(
-                    {
-                        "source": feed_config["name"],
-                        "title": entry.get("title", "").strip(),
-                        "summary": _clean_summary(entry.get("summary", "")),
-                        "published": published,
-                        "url": entry.get("link", ""),
-                    }
-                )
-        except Exception as e:
-            # Log but don't inject error messages as articles into the LLM prompt
-            print(f"[rss_reader] Feed '{feed_config['name']}' konnte nicht geladen werden: {e}")
+    # One thread per feed: the requests overlap instead of adding up
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(feeds), 1)) as executor:
+        for items in executor.map(lambda f: _fetch_feed_articles(f, max_per_feed), feeds):
+            articles.extend(items)
 
     # Sort by publication date, newest first
-    articles.sort(
-        key=lambda a: a["published"] or datetime.min.replace(tzinfo=timezone.utc),
-        reverse=True,
-    )
+    articles.sort(key=lambda a: a["published"] or _MIN_DT, reverse=True)
     return articles
 
 
@@ -72,22 +135,11 @@ def fetch_google_news_articles(
         source, title, summary, published, url
     Gibt [] zurück bei Fehler (kein Crash).
     """
-    import urllib.parse
     encoded = urllib.parse.quote(query)
     url = f"https://news.google.com/rss/search?q={encoded}&hl={hl}&gl={gl}&ceid={gl}:{hl}"
     try:
         raw = _fetch_feed_raw(url)
-        feed = feedparser.parse(raw)
-        articles = []
-        for entry in feed.entries[:max_items]:
-            articles.append({
-                "source": "Google News",
-                "title": entry.get("title", "").strip(),
-                "summary": _clean_summary(entry.get("summary", "")),
-                "published": _parse_date(entry),
-                "url": entry.get("link", ""),
-            })
-        return articles
+        return [{"source": "Google News", **item} for item in _parse_feed(raw, max_items)]
     except Exception as e:
         print(f"[rss_reader] Google News Fehler ({query!r}): {e}")
         return []
@@ -103,8 +155,23 @@ def _parse_date(entry) -> datetime | None:
     return None
 
 
+def _parse_pub_date(value: str | None) -> datetime | None:
+    """Parse an RSS <pubDate> (RFC 822, or ISO 8601 as some feeds use) into a UTC datetime."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
 def _clean_summary(text: str) -> str:
     """Strip HTML tags from a summary string."""
-    import re
-    clean = re.sub(r"<[^>]+>", "", text)
-    return clean.strip()[:500]
+    return _HTML_TAG_RE.sub("", text).strip()[:500]
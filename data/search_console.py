@@ -5,52 +5,26 @@ Returns top queries by impressions and CTR for the last N days.
 Uses a Service Account for authentication.
 """
 
-import json
-import os
 from datetime import date, timedelta
 from googleapiclient.discovery import build
-from google.oauth2 import service_account
-
-
-def _parse_creds_json(s: str) -> dict:
-    """Parse credentials JSON, auch wenn literale Newlines in String-Values stecken."""
-    in_string = False
-    escaped = False
-    out = []
-    for c in s:
-        if escaped:
-            out.append(c); escaped = False
-        elif c == "\\" and in_string:
-            out.append(c); escaped = True
-        elif c == '"':
-            in_string = not in_string; out.append(c)
-        elif c == "\n" and in_string:
-            out.append("\\n")
-        elif c == "\r" and in_string:
-            out.append("\\r")
-        else:
-            out.append(c)
-    return json.loads("".join(out))
+
+from config import CACHE_TTL_ANALYTICS
+from data.cache import ttl_cache
+from data.google_auth import load_credentials
+
+# googleapiclient retries 429/5xx responses with exponential backoff
+_NUM_RETRIES = 3
 
 
 def _get_service(credentials_file: str):
-    creds_json = os.getenv("GOOGLE_CREDENTIALS_JSON")
-    # Fallback: GOOGLE_CREDENTIALS_FILE enthält direkt JSON-Inhalt (z.B. Streamlit Cloud)
-    if not creds_json and credentials_file.strip().startswith("{"):
-        creds_json = credentials_file
-    if creds_json:
-        credentials = service_account.Credentials.from_service_account_info(
-            _parse_creds_json(creds_json),
-            scopes=["https://www.googleapis.com/auth/webmasters.readonly"],
-        )
-    else:
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_file,
-            scopes=["https://www.googleapis.com/auth/webmasters.readonly"],
-        )
+    credentials = load_credentials(
+        credentials_file,
+        scopes=["https://www.googleapis.com/auth/webmasters.readonly"],
+    )
     return build("webmasters", "v3", credentials=credentials)
 
 
+@ttl_cache(CACHE_TTL_ANALYTICS)
 def fetch_top_queries(
     site_url: str,
     credentials_file: str,
@@ -79,7 +53,7 @@ def fetch_top_queries(
     response = (
         service.searchanalytics()
         .query(siteUrl=site_url, body=body)
-        .execute()
+        .execute(num_retries=_NUM_RETRIES)
     )
 
     results = []
@@ -97,6 +71,7 @@ def fetch_top_queries(
     return results
 
 
+@ttl_cache(CACHE_TTL_ANALYTICS)
 def fetch_top_pages_by_position(
     site_url: str,
     credentials_file: str,
@@ -130,7 +105,7 @@ def fetch_top_pages_by_position(
     response = (
         service.searchanalytics()
         .query(siteUrl=site_url, body=body)
-        .execute()
+        .execute(num_retries=_NUM_RETRIES)
     )
 
     results = []
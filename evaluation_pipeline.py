@@ -10,13 +10,31 @@ Data strategy:
     they are used directly (no extra API call).
   - If rss_articles is None, fresh RSS data is fetched.
   - GA4/GSC are left empty when not provided (no credentials required).
+
+The flow is async: RSS and Google News are fetched concurrently (in worker
+threads) and the agents use AsyncOpenAI. run() is a blocking wrapper
+around run_async() for the Streamlit app. It schedules the coroutine on one
+long-lived background event loop, so the pooled AsyncOpenAI client (and its
+warm HTTP connections) is reused across runs; status messages are queued
+and handed back to the calling thread, which shows only the latest pending one.
+
+Feed results are cached in-process for _FEED_CACHE_TTL seconds, so
+re-evaluating the same title, ignoring case and whitespace, skips the HTTP
+calls.
+prefetch() warms that cache in the background while the user is still typing.
 """
 
+import asyncio
+import concurrent.futures
 import os
+import queue
+import threading
+import time
+import weakref
 from dataclasses import dataclass, field
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 import agents.idea_context as idea_context_agent
 import agents.idea_evaluator as idea_evaluator_agent
@@ -24,6 +42,28 @@ from data.rss_reader import fetch_rss_articles, fetch_google_news_articles
 
 load_dotenv()
 
+_FEED_CACHE_TTL = 300  # seconds
+
+# (source, normalised title) → (fetched_at, articles)
+_feed_cache: dict[tuple[str, str], tuple[float, list[dict]]] = {}
+_feed_cache_lock = threading.Lock()
+# Fetches currently running, so concurrent callers wait instead of refetching
+_feed_inflight: dict[tuple[str, str], concurrent.futures.Future] = {}
+
+_prefetch_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="feed-prefetch"
+)
+
+# Background loop for run(); created on first use
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+# One AsyncOpenAI client per event loop (its connection pool is bound to the loop)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[str, AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+_NO_CONTEXT = "Keine Kontextdaten verfügbar."
+
 
 @dataclass
 class EvaluationResult:
@@ -36,6 +76,102 @@ class EvaluationResult:
     errors: list[str] = field(default_factory=list)
 
 
+def _cached_fetch(key: tuple[str, str], fetch) -> list[dict]:
+    """Return cached articles for `key` if fresh, otherwise call fetch() and cache it."""
+    with _feed_cache_lock:
+        entry = _feed_cache.get(key)
+        if entry and time.monotonic() - entry[0] < _FEED_CACHE_TTL:
+            return entry[1]
+        pending = _feed_inflight.get(key)
+        is_owner = pending is None
+        if is_owner:
+            pending = concurrent.futures.Future()
+            _feed_inflight[key] = pending
+
+    if not is_owner:
+        return pending.result()
+
+    try:
+        articles = fetch()
+    except Exception as e:
+        with _feed_cache_lock:
+            _feed_inflight.pop(key, None)
+        pending.set_exception(e)
+        raise
+
+    now = time.monotonic()
+    with _feed_cache_lock:
+        # Empty results usually mean a swallowed fetch error — don't pin them
+        if articles:
+            for stale in [k for k, (ts, _) in _feed_cache.items() if now - ts >= _FEED_CACHE_TTL]:
+                del _feed_cache[stale]
+            _feed_cache[key] = (now, articles)
+        _feed_inflight.pop(key, None)
+    pending.set_result(articles)
+    return articles
+
+
+def _cached_rss() -> list[dict]:
+    return _cached_fetch(("rss", ""), fetch_rss_articles)
+
+
+def _cached_gn(idea_title: str) -> list[dict]:
+    return _cached_fetch(
+        # Only case and whitespace are folded — distinct titles keep distinct entries
+        ("google_news", " ".join(idea_title.casefold().split())),
+        lambda: fetch_google_news_articles(idea_title),
+    )
+
+
+def prefetch(idea_title: str, include_rss: bool = True) -> None:
+    """
+    Warm the feed cache for `idea_title` in the background and return immediately.
+
+    A later run() for the same title reuses the result, or waits for the
+    prefetch if it is still in flight. Set include_rss=False when the caller
+    will pass its own rss_articles to run().
+    """
+    if not idea_title.strip():
+        return
+    _prefetch_executor.submit(_cached_gn, idea_title)
+    if include_rss:
+        _prefetch_executor.submit(_cached_rss)
+
+
+async def _resolved(value):
+    return value
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="evaluation-loop", daemon=True
+            ).start()
+        return _loop
+
+
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Return the pooled AsyncOpenAI client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    cached = _clients.get(loop)
+    if cached is None or cached[0] != api_key:
+        cached = (api_key, AsyncOpenAI(api_key=api_key))
+        _clients[loop] = cached
+    return cached[1]
+
+
+def _merge_by_url(*sources: list[dict]) -> list[dict]:
+    """Concatenate article lists, dropping repeated URLs (first occurrence wins)."""
+    merged: dict[str, dict] = {}
+    for articles in sources:
+        for a in articles:
+            merged.setdefault(a["url"], a)
+    return list(merged.values())
+
+
 def run(
     idea_title: str,
     idea_desc: str = "",
@@ -59,6 +195,45 @@ def run(
         EvaluationResult with verdict, score, pros, cons, recommendation,
         context_notes (raw agent output), and any errors.
     """
+    messages: queue.SimpleQueue = queue.SimpleQueue()
+    future = asyncio.run_coroutine_threadsafe(
+        run_async(
+            idea_title,
+            idea_desc=idea_desc,
+            rss_articles=rss_articles,
+            ga4_pages=ga4_pages,
+            gsc_queries=gsc_queries,
+            status_callback=messages.put if status_callback else None,
+        ),
+        _get_loop(),
+    )
+    # Status callbacks run here: Streamlit UI calls need the script thread.
+    # The pipeline only enqueues, so a slow UI never delays the agents.
+    while status_callback and (not future.done() or not messages.empty()):
+        try:
+            msg = messages.get(timeout=0.05)
+        except queue.Empty:
+            continue
+        # Each status replaces the previous one — skip those the UI fell behind on
+        while not messages.empty():
+            msg = messages.get_nowait()
+        try:
+            status_callback(msg)
+        except Exception as e:
+            print(f"[evaluation_pipeline] status_callback Fehler: {e}")
+            status_callback = None
+    return future.result()
+
+
+async def run_async(
+    idea_title: str,
+    idea_desc: str = "",
+    rss_articles: list[dict] | None = None,
+    ga4_pages: list[dict] | None = None,
+    gsc_queries: list[dict] | None = None,
+    status_callback=None,
+) -> EvaluationResult:
+    """Async implementation of run(); same arguments and return value."""
 
     def status(msg: str):
         if status_callback:
@@ -71,36 +246,36 @@ def run(
         result.errors.append("OPENAI_API_KEY fehlt in der .env-Datei.")
         return result
 
-    client = OpenAI(api_key=api_key)
+    client = _get_client(api_key)
 
-    # --- Step 1: Fetch RSS if not provided ---
-    if rss_articles is None:
+    # --- Step 1: RSS (if not provided) and Google News in parallel ---
+    fetch_rss = rss_articles is None
+    if fetch_rss:
         status("RSS-Feeds werden geladen...")
-        try:
-            rss_articles = fetch_rss_articles()
-        except Exception as e:
-            result.errors.append(f"RSS-Fehler: {e}")
-            rss_articles = []
+    status("Google News wird durchsucht...")
+    rss_fetched, gn_fetched = await asyncio.gather(
+        asyncio.to_thread(_cached_rss) if fetch_rss else _resolved(rss_articles),
+        asyncio.to_thread(_cached_gn, idea_title),
+        return_exceptions=True,
+    )
+
+    if isinstance(rss_fetched, Exception):
+        result.errors.append(f"RSS-Fehler: {rss_fetched}")
+        rss_fetched = []
+    if isinstance(gn_fetched, Exception):
+        result.errors.append(f"Google News Fehler: {gn_fetched}")
+        gn_fetched = []
+
+    # New list, so the caller's (cached pipeline) rss_articles is never mutated
+    rss_articles = _merge_by_url(rss_fetched, gn_fetched)
 
     ga4_pages = ga4_pages or []
     gsc_queries = gsc_queries or []
 
-    # --- Step 1b: Google News dynamisch nach Ideen-Titel durchsuchen ---
-    status("Google News wird durchsucht...")
-    try:
-        gn_articles = fetch_google_news_articles(idea_title)
-        existing_urls = {a["url"] for a in rss_articles}
-        for a in gn_articles:
-            if a["url"] not in existing_urls:
-                rss_articles.append(a)
-                existing_urls.add(a["url"])
-    except Exception as e:
-        result.errors.append(f"Google News Fehler: {e}")
-
     # --- Step 2: Agent 1 – Kontext-Agent ---
     status("Kontext-Agent sucht relevante Signale...")
     try:
-        result.context_notes = idea_context_agent.run(
+        result.context_notes = await idea_context_agent.arun(
             client=client,
             idea_title=idea_title,
             idea_desc=idea_desc,
@@ -110,12 +285,12 @@ def run(
         )
     except Exception as e:
         result.errors.append(f"Kontext-Agent Fehler: {e}")
-        result.context_notes = "Keine Kontextdaten verfügbar."
+        result.context_notes = _NO_CONTEXT
 
     # --- Step 3: Agent 2 – Bewertungs-Agent ---
     status("Idee wird bewertet...")
     try:
-        evaluation = idea_evaluator_agent.run(
+        evaluation = await idea_evaluator_agent.arun(
             client=client,
             idea_title=idea_title,
             idea_desc=idea_desc,
@@ -4,8 +4,22 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from dataclasses import dataclass, field
 from datetime import date
-from io import BytesIO
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _fpdf():
+    """Import fpdf2 on the first PDF export; the module is reused afterwards."""
+    import fpdf
+    import fpdf.fonts
+
+    return fpdf
+
+
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_COLLAPSE = re.compile(r"[\s_-]+")
 
 
 def _slugify(text: str) -> str:
@@ -13,116 +27,123 @@ def _slugify(text: str) -> str:
     text = unicodedata.normalize("NFKD", text)
     text = text.encode("ascii", "ignore").decode("ascii")
     text = text.lower()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_-]+", "-", text)
+    text = _SLUG_STRIP.sub("", text)
+    text = _SLUG_COLLAPSE.sub("-", text)
     text = text.strip("-")
     return text or "artikel"
 
 
-def article_to_markdown(article: dict, social_snippets: dict | None = None, journalist_notes: str = "") -> str:
-    """Return the article as a Markdown string."""
-    parts: list[str] = []
+def _social_blocks(social_snippets: dict) -> list[tuple[str, str]]:
+    """Return (heading, text) for each non-empty social snippet, in export order."""
+    blocks = [
+        ("LinkedIn", social_snippets.get("linkedin", "")),
+        ("X / Twitter", social_snippets.get("twitter", "") or social_snippets.get("x", "")),
+        ("Newsletter-Teaser", social_snippets.get("newsletter_teaser", "")),
+    ]
+    return [(label, text) for label, text in blocks if text]
 
+
+def _md_lines(article: dict, social_snippets: dict | None, journalist_notes: str):
     title = article.get("title", "")
     lead = article.get("lead", "")
     sections = article.get("sections", [])
     meta_description = article.get("meta_description", "")
 
     if title:
-        parts.append(f"# {title}")
-        parts.append("")
+        yield f"# {title}"
+        yield ""
 
     if lead:
-        parts.append(f"_{lead}_")
-        parts.append("")
-        parts.append("---")
-        parts.append("")
+        yield f"_{lead}_"
+        yield ""
+        yield "---"
+        yield ""
 
     for section in sections:
         heading = section.get("heading", "")
         content = section.get("content", "")
         if heading:
-            parts.append(f"## {heading}")
+            yield f"## {heading}"
         if content:
-            parts.append(content)
-        parts.append("")
+            yield content
+        yield ""
 
     if meta_description:
-        parts.append("---")
-        parts.append("")
-        parts.append(f"**Meta-Beschreibung:** {meta_description}")
-        parts.append("")
+        yield "---"
+        yield ""
+        yield f"**Meta-Beschreibung:** {meta_description}"
+        yield ""
 
     if social_snippets:
-        parts.append("---")
-        parts.append("")
-        parts.append("## Social Media")
-        parts.append("")
-
-        linkedin = social_snippets.get("linkedin", "")
-        twitter = social_snippets.get("twitter", "") or social_snippets.get("x", "")
-        newsletter = social_snippets.get("newsletter_teaser", "")
-
-        if linkedin:
-            parts.append("### LinkedIn")
-            parts.append(linkedin)
-            parts.append("")
-
-        if twitter:
-            parts.append("### X / Twitter")
-            parts.append(twitter)
-            parts.append("")
-
-        if newsletter:
-            parts.append("### Newsletter-Teaser")
-            parts.append(newsletter)
-            parts.append("")
+        yield "---"
+        yield ""
+        yield "## Social Media"
+        yield ""
+
+        for label, text in _social_blocks(social_snippets):
+            yield f"### {label}"
+            yield text
+            yield ""
 
     if journalist_notes:
-        parts.append("---")
-        parts.append("")
-        parts.append("## Hinweise für den Journalisten")
-        parts.append("")
-        parts.append(journalist_notes)
+        yield "---"
+        yield ""
+        yield "## Hinweise für den Journalisten"
+        yield ""
+        yield journalist_notes
 
-    return "\n".join(parts)
+
+def article_to_markdown(article: dict, social_snippets: dict | None = None, journalist_notes: str = "") -> str:
+    """Return the article as a Markdown string."""
+    return "\n".join(_md_lines(article, social_snippets, journalist_notes))
+
+
+# Unicode characters that Latin-1 (fpdf built-in fonts) cannot encode
+_PDF_TRANSLATE = str.maketrans({
+    "\u2014": "-",   # em dash
+    "\u2013": "-",   # en dash
+    "\u2012": "-",   # figure dash
+    "\u2015": "-",   # horizontal bar
+    "\u2018": "'",   # left single quote
+    "\u2019": "'",   # right single quote
+    "\u201A": "'",   # single low-9 quote
+    "\u201C": '"',   # left double quote
+    "\u201D": '"',   # right double quote
+    "\u201E": '"',   # double low-9 quote
+    "\u2026": "...", # ellipsis
+    "\u2022": "-",   # bullet
+    "\u2033": '"',   # double prime
+    "\u2032": "'",   # prime
+    "\u00A0": " ",   # non-breaking space
+    "\u200B": "",    # zero-width space
+    "\u200C": "",    # zero-width non-joiner
+    "\u200D": "",    # zero-width joiner
+    "\uFEFF": "",    # BOM
+})
+
+
+# Only short strings (headings, labels, idea titles) are worth memoizing
+_SANITIZE_CACHE_MAX_LEN = 512
+
+
+def _to_latin1(text: str) -> str:
+    # Fallback: encode to Latin-1, replacing any remaining unknown chars
+    return text.translate(_PDF_TRANSLATE).encode("latin-1", errors="replace").decode("latin-1")
+
+
+_to_latin1_cached = lru_cache(maxsize=2048)(_to_latin1)
 
 
 def _sanitize_for_pdf(text: str) -> str:
     """Replace Unicode characters that Latin-1 (fpdf built-in fonts) cannot encode."""
-    replacements = {
-        "\u2014": "-",   # em dash
-        "\u2013": "-",   # en dash
-        "\u2012": "-",   # figure dash
-        "\u2015": "-",   # horizontal bar
-        "\u2018": "'",   # left single quote
-        "\u2019": "'",   # right single quote
-        "\u201A": "'",   # single low-9 quote
-        "\u201C": '"',   # left double quote
-        "\u201D": '"',   # right double quote
-        "\u201E": '"',   # double low-9 quote
-        "\u2026": "...", # ellipsis
-        "\u2022": "-",   # bullet
-        "\u2033": '"',   # double prime
-        "\u2032": "'",   # prime
-        "\u00A0": " ",   # non-breaking space
-        "\u200B": "",    # zero-width space
-        "\u200C": "",    # zero-width non-joiner
-        "\u200D": "",    # zero-width joiner
-        "\uFEFF": "",    # BOM
-    }
-    for char, repl in replacements.items():
-        text = text.replace(char, repl)
-    # Fallback: encode to Latin-1, replacing any remaining unknown chars
-    text = text.encode("latin-1", errors="replace").decode("latin-1")
-    return text
+    if len(text) < _SANITIZE_CACHE_MAX_LEN:
+        return _to_latin1_cached(text)
+    return _to_latin1(text)
 
 
 def article_to_pdf(article: dict, social_snippets: dict | None = None, journalist_notes: str = "") -> bytes:
     """Return the article as PDF bytes using fpdf2."""
-    from fpdf import FPDF
-
-    pdf = FPDF()
+    pdf = _fpdf().FPDF()
     pdf.set_auto_page_break(auto=True, margin=20)
     pdf.add_page()
     pdf.set_margins(20, 20, 20)
@@ -177,29 +198,11 @@ def article_to_pdf(article: dict, social_snippets: dict | None = None, journalis
         pdf.cell(0, 10, "Social Media", new_x="LMARGIN", new_y="NEXT")
         pdf.ln(4)
 
-        linkedin = _sanitize_for_pdf(social_snippets.get("linkedin", ""))
-        twitter = _sanitize_for_pdf(social_snippets.get("twitter", "") or social_snippets.get("x", ""))
-        newsletter = _sanitize_for_pdf(social_snippets.get("newsletter_teaser", ""))
-
-        if linkedin:
+        for label, text in _social_blocks(social_snippets):
             pdf.set_font("Helvetica", style="B", size=12)
-            pdf.cell(0, 8, "LinkedIn", new_x="LMARGIN", new_y="NEXT")
+            pdf.cell(0, 8, label, new_x="LMARGIN", new_y="NEXT")
             pdf.set_font("Helvetica", size=11)
-            pdf.multi_cell(0, 6, linkedin, new_x="LMARGIN", new_y="NEXT")
-            pdf.ln(4)
-
-        if twitter:
-            pdf.set_font("Helvetica", style="B", size=12)
-            pdf.cell(0, 8, "X / Twitter", new_x="LMARGIN", new_y="NEXT")
-            pdf.set_font("Helvetica", size=11)
-            pdf.multi_cell(0, 6, twitter, new_x="LMARGIN", new_y="NEXT")
-            pdf.ln(4)
-
-        if newsletter:
-            pdf.set_font("Helvetica", style="B", size=12)
-            pdf.cell(0, 8, "Newsletter-Teaser", new_x="LMARGIN", new_y="NEXT")
-            pdf.set_font("Helvetica", size=11)
-            pdf.multi_cell(0, 6, newsletter, new_x="LMARGIN", new_y="NEXT")
+            pdf.multi_cell(0, 6, _sanitize_for_pdf(text), new_x="LMARGIN", new_y="NEXT")
             pdf.ln(4)
 
     if journalist_notes:
@@ -210,9 +213,124 @@ def article_to_pdf(article: dict, social_snippets: dict | None = None, journalis
         pdf.set_font("Helvetica", size=10)
         pdf.multi_cell(0, 6, _sanitize_for_pdf(journalist_notes))
 
-    buf = BytesIO()
-    pdf.output(buf)
-    return buf.getvalue()
+    return bytes(pdf.output())
+
+
+@dataclass
+class _ReportIdea:
+    heading: str
+    caption: str = ""
+    why_now: str = ""
+    signals: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _ReportStrings:
+    """All dynamic text of the client report, already sanitized for fpdf."""
+    bullets: list[str] = field(default_factory=list)
+    seo_summary: list[str] = field(default_factory=list)
+    opportunity_rows: list[tuple[str, str, str]] = field(default_factory=list)
+    ideas: list[_ReportIdea] = field(default_factory=list)
+    calendar_rows: list[tuple[str, str, str, str, str]] = field(default_factory=list)
+
+
+def _report_strings(result, calendar: list[dict] | None) -> _ReportStrings:
+    ideas = getattr(result, "ideas", []) or []
+    gsc_queries = getattr(result, "gsc_queries", []) or []
+    rss_articles = getattr(result, "rss_articles", []) or []
+    ga4_pages = getattr(result, "ga4_pages", []) or []
+    seo_pot = getattr(result, "seo_potential", {}) or {}
+    trends_data = getattr(result, "trends_data", []) or []
+
+    # Data sources bullet
+    sources = []
+    if ga4_pages:
+        sources.append(f"Google Analytics 4 ({len(ga4_pages)} Seiten)")
+    if gsc_queries:
+        sources.append(f"Search Console ({len(gsc_queries)} Suchanfragen)")
+    if rss_articles:
+        sources.append(f"RSS-Feeds ({len(rss_articles)} Artikel)")
+    if trends_data:
+        sources.append(f"Google Trends ({len(trends_data)} Keywords)")
+
+    # Strongest signal
+    top_idea = ideas[0] if ideas else None
+    strongest_signal = ""
+    if top_idea:
+        sigs = top_idea.get("signals", {})
+        for key in ("rss", "gsc", "ga4"):
+            if sigs.get(key):
+                strongest_signal = str(sigs[key])[:120]
+                break
+
+    bullets = [
+        f"Analysierte Content-Ideen: {len(ideas)}",
+        f"Datenquellen: {', '.join(sources) if sources else 'Keine Daten verfuegbar'}",
+        f"Starktes Signal: {strongest_signal}" if strongest_signal else "Kein dominierendes Signal identifiziert",
+        f"Geschaetztes Traffic-Potenzial: +{seo_pot.get('total_potential', 0):,} Besucher/Monat" if seo_pot.get("total_potential") else "Traffic-Potenzial: Keine GSC-Daten",
+    ]
+    if seo_pot.get("top_opportunities"):
+        top_opp = seo_pot["top_opportunities"][0]
+        bullets.append(f"Top Quick Win: {top_opp['label']} (+{top_opp['monthly_delta']:,} Klicks/Monat)")
+    else:
+        bullets.append("Top Quick Win: Keine Daten verfuegbar")
+
+    seo_summary = [
+        f"Fast-Ranker-Potenzial: +{seo_pot.get('fast_ranker_potential', 0):,} Klicks/Monat",
+        f"CTR-Lucken-Potenzial: +{seo_pot.get('ctr_gap_potential', 0):,} Klicks/Monat",
+        f"Gesamt-Potenzial: +{seo_pot.get('total_potential', 0):,} Klicks/Monat",
+    ] if seo_pot else []
+
+    report_ideas = []
+    for idx, idea in enumerate(ideas[:3], 1):
+        title = _sanitize_for_pdf(idea.get("title", ""))
+        category = _sanitize_for_pdf(idea.get("category", ""))
+        score = idea.get("score", "")
+        why_now = _sanitize_for_pdf(idea.get("why_now", ""))
+        signals = idea.get("signals", {})
+
+        caption_parts = []
+        if category:
+            caption_parts.append(f"Kategorie: {category}")
+        if score:
+            caption_parts.append(f"Score: {score}")
+
+        report_ideas.append(
+            _ReportIdea(
+                heading=f"{idx}. {title}",
+                caption=_sanitize_for_pdf(" | ".join(caption_parts)),
+                why_now=f"Warum jetzt? {why_now}" if why_now else "",
+                signals=[
+                    _sanitize_for_pdf(f"- {label}: {str(signals[key])[:100]}")
+                    for key, label in [("ga4", "GA4"), ("gsc", "Search Console"), ("rss", "RSS")]
+                    if signals.get(key)
+                ],
+            )
+        )
+
+    return _ReportStrings(
+        bullets=[_sanitize_for_pdf(b) for b in bullets],
+        seo_summary=[_sanitize_for_pdf(line) for line in seo_summary],
+        opportunity_rows=[
+            (
+                _sanitize_for_pdf(opp.get("label", ""))[:45],
+                str(opp.get("current_position", "")),
+                f"+{opp.get('monthly_delta', 0):,}",
+            )
+            for opp in seo_pot.get("top_opportunities", [])
+        ],
+        ideas=report_ideas,
+        calendar_rows=[
+            (
+                str(entry["week"]),
+                entry["publish_date"].strftime("%d.%m."),
+                _sanitize_for_pdf(entry["idea"].get("title", ""))[:55],
+                _sanitize_for_pdf(entry["idea"].get("category", ""))[:20],
+                str(entry["idea"].get("score", "")),
+            )
+            for entry in calendar or []
+        ],
+    )
 
 
 def create_client_report(result, calendar: list[dict] | None = None) -> bytes:
@@ -224,42 +342,59 @@ def create_client_report(result, calendar: list[dict] | None = None) -> bytes:
     4. Top 3 Content ideas
     5. 4-week editorial calendar
     """
-    from fpdf import FPDF
+    fpdf = _fpdf()
+    strings = _report_strings(result, calendar)
+    table_headings = fpdf.fonts.FontFace(emphasis="BOLD", size_pt=10, fill_color=(230, 235, 245))
 
-    pdf = FPDF()
+    pdf = fpdf.FPDF()
     pdf.set_auto_page_break(auto=True, margin=20)
     pdf.set_margins(20, 20, 20)
 
+    # Text passed to the helpers below must already be Latin-1 safe
+    # (literals or fields of `strings`). Every emitter sets its own font and
+    # colour; nothing resets them afterwards.
+
+    # Last font/colour sent to fpdf — unchanged state is not set again
+    current = {"font": None, "color": None}
+
+    def font(style: str, size: int):
+        if current["font"] != (style, size):
+            pdf.set_font("Helvetica", style=style, size=size)
+            current["font"] = (style, size)
+
+    def color(r: int, g: int, b: int):
+        if current["color"] != (r, g, b):
+            pdf.set_text_color(r, g, b)
+            current["color"] = (r, g, b)
+
     def h1(text: str):
-        pdf.set_font("Helvetica", style="B", size=22)
-        pdf.set_text_color(30, 30, 30)
-        pdf.multi_cell(0, 12, _sanitize_for_pdf(text), new_x="LMARGIN", new_y="NEXT")
+        font("B", 22)
+        color(30, 30, 30)
+        pdf.multi_cell(0, 12, text, new_x="LMARGIN", new_y="NEXT")
         pdf.ln(4)
 
     def h2(text: str):
-        pdf.set_font("Helvetica", style="B", size=15)
-        pdf.set_text_color(50, 80, 150)
-        pdf.multi_cell(0, 9, _sanitize_for_pdf(text), new_x="LMARGIN", new_y="NEXT")
-        pdf.set_text_color(0, 0, 0)
+        font("B", 15)
+        color(50, 80, 150)
+        pdf.multi_cell(0, 9, text, new_x="LMARGIN", new_y="NEXT")
         pdf.ln(2)
 
     def h3(text: str):
-        pdf.set_font("Helvetica", style="B", size=12)
-        pdf.set_text_color(30, 30, 30)
-        pdf.multi_cell(0, 7, _sanitize_for_pdf(text), new_x="LMARGIN", new_y="NEXT")
+        font("B", 12)
+        color(30, 30, 30)
+        pdf.multi_cell(0, 7, text, new_x="LMARGIN", new_y="NEXT")
         pdf.ln(1)
 
     def body(text: str):
-        pdf.set_font("Helvetica", size=11)
-        pdf.set_text_color(40, 40, 40)
-        pdf.multi_cell(0, 6, _sanitize_for_pdf(text), new_x="LMARGIN", new_y="NEXT")
+        font("", 11)
+        color(40, 40, 40)
+        pdf.multi_cell(0, 6, text, new_x="LMARGIN", new_y="NEXT")
         pdf.ln(2)
 
     def caption(text: str):
-        pdf.set_font("Helvetica", style="I", size=9)
-        pdf.set_text_color(120, 120, 120)
-        pdf.multi_cell(0, 5, _sanitize_for_pdf(text), new_x="LMARGIN", new_y="NEXT")
-        pdf.set_text_color(0, 0, 0)
+        font("I", 9)
+        color(120, 120, 120)
+        pdf.multi_cell(0, 5, text, new_x="LMARGIN", new_y="NEXT")
         pdf.ln(1)
 
     def divider():
@@ -270,75 +405,34 @@ def create_client_report(result, calendar: list[dict] | None = None) -> bytes:
     # ── Page 1: Cover ──────────────────────────────────────────────────────────
     pdf.add_page()
     pdf.ln(40)
-    pdf.set_font("Helvetica", style="B", size=28)
-    pdf.set_text_color(30, 30, 30)
+    font("B", 28)
+    color(30, 30, 30)
     pdf.multi_cell(0, 14, "Content-Strategie Report", align="C", new_x="LMARGIN", new_y="NEXT")
     pdf.ln(6)
-    pdf.set_font("Helvetica", size=14)
-    pdf.set_text_color(80, 80, 80)
+    font("", 14)
+    color(80, 80, 80)
     pdf.cell(0, 8, date.today().strftime("%d. %B %Y"), align="C", new_x="LMARGIN", new_y="NEXT")
     pdf.ln(4)
-    pdf.set_font("Helvetica", style="I", size=11)
-    pdf.set_text_color(120, 120, 120)
+    font("I", 11)
+    color(120, 120, 120)
     pdf.cell(0, 7, "Erstellt mit KI-Content-Analyse", align="C", new_x="LMARGIN", new_y="NEXT")
     pdf.ln(20)
     pdf.set_draw_color(50, 80, 150)
     pdf.set_line_width(0.8)
     pdf.line(60, pdf.get_y(), 150, pdf.get_y())
     pdf.set_line_width(0.2)
-    pdf.set_text_color(0, 0, 0)
 
     # ── Page 2: Executive Summary ──────────────────────────────────────────────
     pdf.add_page()
     h1("Executive Summary")
     divider()
 
-    ideas = getattr(result, "ideas", []) or []
-    gsc_queries = getattr(result, "gsc_queries", []) or []
-    rss_articles = getattr(result, "rss_articles", []) or []
-    ga4_pages = getattr(result, "ga4_pages", []) or []
-    seo_pot = getattr(result, "seo_potential", {}) or {}
-    trends_data = getattr(result, "trends_data", []) or []
-
-    # Data sources bullet
-    sources = []
-    if ga4_pages:
-        sources.append(f"Google Analytics 4 ({len(ga4_pages)} Seiten)")
-    if gsc_queries:
-        sources.append(f"Search Console ({len(gsc_queries)} Suchanfragen)")
-    if rss_articles:
-        sources.append(f"RSS-Feeds ({len(rss_articles)} Artikel)")
-    if trends_data:
-        sources.append(f"Google Trends ({len(trends_data)} Keywords)")
-
-    # Strongest signal
-    top_idea = ideas[0] if ideas else None
-    strongest_signal = ""
-    if top_idea:
-        sigs = top_idea.get("signals", {})
-        for key in ("rss", "gsc", "ga4"):
-            if sigs.get(key):
-                strongest_signal = str(sigs[key])[:120]
-                break
-
-    bullets = [
-        f"Analysierte Content-Ideen: {len(ideas)}",
-        f"Datenquellen: {', '.join(sources) if sources else 'Keine Daten verfuegbar'}",
-        f"Starktes Signal: {strongest_signal}" if strongest_signal else "Kein dominierendes Signal identifiziert",
-        f"Geschaetztes Traffic-Potenzial: +{seo_pot.get('total_potential', 0):,} Besucher/Monat" if seo_pot.get("total_potential") else "Traffic-Potenzial: Keine GSC-Daten",
-    ]
-    if seo_pot.get("top_opportunities"):
-        top_opp = seo_pot["top_opportunities"][0]
-        bullets.append(f"Top Quick Win: {top_opp['label']} (+{top_opp['monthly_delta']:,} Klicks/Monat)")
-    else:
-        bullets.append("Top Quick Win: Keine Daten verfuegbar")
-
     pdf.ln(2)
-    for bullet in bullets:
-        pdf.set_font("Helvetica", size=11)
-        pdf.set_text_color(40, 40, 40)
+    font("", 11)
+    color(40, 40, 40)
+    for bullet in strings.bullets:
         pdf.cell(6, 7, "-", new_x="RIGHT", new_y="TOP")
-        pdf.multi_cell(0, 7, _sanitize_for_pdf(bullet), new_x="LMARGIN", new_y="NEXT")
+        pdf.multi_cell(0, 7, bullet, new_x="LMARGIN", new_y="NEXT")
         pdf.ln(1)
 
     # ── Page 3: SEO Potential ──────────────────────────────────────────────────
@@ -346,34 +440,26 @@ def create_client_report(result, calendar: list[dict] | None = None) -> bytes:
     h1("SEO-Chancen & Quick Wins")
     divider()
 
-    if seo_pot:
+    if strings.seo_summary:
         h2("Zusammenfassung Potenzial")
-        body(f"Fast-Ranker-Potenzial: +{seo_pot.get('fast_ranker_potential', 0):,} Klicks/Monat")
-        body(f"CTR-Lucken-Potenzial: +{seo_pot.get('ctr_gap_potential', 0):,} Klicks/Monat")
-        body(f"Gesamt-Potenzial: +{seo_pot.get('total_potential', 0):,} Klicks/Monat")
+        for line in strings.seo_summary:
+            body(line)
         pdf.ln(4)
 
-        top_opps = seo_pot.get("top_opportunities", [])
-        if top_opps:
+        if strings.opportunity_rows:
             h2("Top Opportunitaten (Quick Wins)")
-            # Table header
-            pdf.set_fill_color(230, 235, 245)
-            pdf.set_font("Helvetica", style="B", size=10)
-            col_w = [90, 30, 50]
-            headers = ["Seite / Keyword", "Position", "+Klicks/Monat"]
-            for header, w in zip(headers, col_w):
-                pdf.cell(w, 8, header, border=1, fill=True, new_x="RIGHT", new_y="TOP")
-            pdf.ln(8)
-            # Table rows
-            pdf.set_font("Helvetica", size=9)
-            for opp in top_opps:
-                label = _sanitize_for_pdf(opp.get("label", ""))[:45]
-                pos = str(opp.get("current_position", ""))
-                delta = f"+{opp.get('monthly_delta', 0):,}"
-                pdf.cell(col_w[0], 7, label, border=1, new_x="RIGHT", new_y="TOP")
-                pdf.cell(col_w[1], 7, pos, border=1, align="C", new_x="RIGHT", new_y="TOP")
-                pdf.cell(col_w[2], 7, delta, border=1, align="C", new_x="RIGHT", new_y="TOP")
-                pdf.ln(7)
+            font("", 9)
+            color(0, 0, 0)
+            with pdf.table(
+                col_widths=(90, 30, 50),
+                align="LEFT",
+                line_height=7,
+                text_align=("LEFT", "CENTER", "CENTER"),
+                headings_style=table_headings,
+            ) as table:
+                table.row(("Seite / Keyword", "Position", "+Klicks/Monat"))
+                for row in strings.opportunity_rows:
+                    table.row(row)
     else:
         body("Keine GSC-Daten verfuegbar. Verbinden Sie Google Search Console fuer Traffic-Potenzial-Berechnungen.")
 
@@ -382,36 +468,20 @@ def create_client_report(result, calendar: list[dict] | None = None) -> bytes:
     h1("Top 3 Content-Ideen")
     divider()
 
-    for idx, idea in enumerate(ideas[:3], 1):
-        title = _sanitize_for_pdf(idea.get("title", ""))
-        category = _sanitize_for_pdf(idea.get("category", ""))
-        score = idea.get("score", "")
-        why_now = _sanitize_for_pdf(idea.get("why_now", ""))
-        signals = idea.get("signals", {})
+    for idx, idea in enumerate(strings.ideas, 1):
+        h3(idea.heading)
+        if idea.caption:
+            caption(idea.caption)
+        if idea.why_now:
+            body(idea.why_now)
 
-        h3(f"{idx}. {title}")
-        caption_parts = []
-        if category:
-            caption_parts.append(f"Kategorie: {category}")
-        if score:
-            caption_parts.append(f"Score: {score}")
-        if caption_parts:
-            caption(" | ".join(caption_parts))
-        if why_now:
-            body(f"Warum jetzt? {why_now}")
-
-        signal_parts = []
-        for key, label in [("ga4", "GA4"), ("gsc", "Search Console"), ("rss", "RSS")]:
-            if signals.get(key):
-                signal_parts.append(f"{label}: {str(signals[key])[:100]}")
-        if signal_parts:
-            pdf.set_font("Helvetica", style="I", size=9)
-            pdf.set_text_color(80, 80, 80)
-            for sp in signal_parts:
-                pdf.multi_cell(0, 5, _sanitize_for_pdf(f"- {sp}"), new_x="LMARGIN", new_y="NEXT")
-            pdf.set_text_color(0, 0, 0)
-
-        if idx < min(3, len(ideas)):
+        if idea.signals:
+            font("I", 9)
+            color(80, 80, 80)
+            for line in idea.signals:
+                pdf.multi_cell(0, 5, line, new_x="LMARGIN", new_y="NEXT")
+
+        if idx < len(strings.ideas):
             divider()
 
     # ── Page 5: Editorial Calendar ─────────────────────────────────────────────
@@ -419,33 +489,19 @@ def create_client_report(result, calendar: list[dict] | None = None) -> bytes:
     h1("4-Wochen-Redaktionsplan")
     divider()
 
-    if calendar:
-        # Table header
-        pdf.set_fill_color(230, 235, 245)
-        pdf.set_font("Helvetica", style="B", size=10)
-        col_w = [20, 25, 90, 30, 15]
-        headers = ["Woche", "Datum", "Titel", "Kategorie", "Score"]
-        for header, w in zip(headers, col_w):
-            pdf.cell(w, 8, header, border=1, fill=True, new_x="RIGHT", new_y="TOP")
-        pdf.ln(8)
-        # Table rows
-        pdf.set_font("Helvetica", size=9)
-        for entry in calendar:
-            idea = entry["idea"]
-            week_str = str(entry["week"])
-            date_str = entry["publish_date"].strftime("%d.%m.")
-            title_str = _sanitize_for_pdf(idea.get("title", ""))[:55]
-            cat_str = _sanitize_for_pdf(idea.get("category", ""))[:20]
-            score_str = idea.get("score", "")
-            pdf.cell(col_w[0], 7, week_str, border=1, align="C", new_x="RIGHT", new_y="TOP")
-            pdf.cell(col_w[1], 7, date_str, border=1, align="C", new_x="RIGHT", new_y="TOP")
-            pdf.cell(col_w[2], 7, title_str, border=1, new_x="RIGHT", new_y="TOP")
-            pdf.cell(col_w[3], 7, cat_str, border=1, new_x="RIGHT", new_y="TOP")
-            pdf.cell(col_w[4], 7, score_str, border=1, align="C", new_x="RIGHT", new_y="TOP")
-            pdf.ln(7)
+    if strings.calendar_rows:
+        font("", 9)
+        with pdf.table(
+            col_widths=(20, 25, 90, 30, 15),  # relative, scaled to the page width
+            align="LEFT",
+            line_height=7,
+            text_align=("CENTER", "CENTER", "LEFT", "LEFT", "CENTER"),
+            headings_style=table_headings,
+        ) as table:
+            table.row(("Woche", "Datum", "Titel", "Kategorie", "Score"))
+            for row in strings.calendar_rows:
+                table.row(row)
     else:
         body("Kein Redaktionsplan verfugbar.")
 
-    buf = BytesIO()
-    pdf.output(buf)
-    return buf.getvalue()
+    return bytes(pdf.output())
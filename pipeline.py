@@ -1,24 +1,33 @@
 """
 Pipeline orchestrator.
 
-Runs all 4 agents in sequence, fetching data sources in parallel first.
-Returns the final list of content ideas.
+Runs the 4 agents as a dataflow over the data sources: all fetches start in
+parallel, and each consumer starts as soon as its own inputs have landed —
+the crawler after GA4, the Trend Scout after RSS, the Analyst after GA4, GSC
+and Trends. The Strategist waits for both agents, then the Editor refines
+its output. Returns the final list of content ideas.
 
 New in this version:
   - Crawls top GA4 pages to give the Strategist existing-content context
   - Fetches GSC page-level positions (Fast-Ranker detection)
   - Fetches 90-day GA4 + GSC data alongside the 7-day data
-  - Persists generated ideas to data/ideas_history.json
+  - Persists generated ideas to data/ideas_history.jsonl (append-only, last 30 runs)
 """
 
+import collections
 import concurrent.futures
-import json
 import os
+import queue
+import tempfile
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, date
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
 
+import orjson
 from dotenv import load_dotenv
 from openai import OpenAI
 
@@ -26,20 +35,35 @@ import agents.analyst as analyst_agent
 import agents.trend_scout as trend_scout_agent
 import agents.strategist as strategist_agent
 import agents.editor as editor_agent
-from data.google_analytics import fetch_top_pages
+from data.google_analytics import fetch_top_pages_batch
 from data.rss_reader import fetch_rss_articles
 from data.search_console import fetch_top_queries, fetch_top_pages_by_position
 from data.content_crawler import crawl_top_pages, format_crawl_summaries
 from data.google_trends import fetch_trending_topics
-from config import ANALYTICS_DAYS_BACK, ANALYTICS_DAYS_LONG, CRAWL_TOP_PAGES, TRENDS_GEO, TRENDS_LIMIT
+from config import (
+    ANALYTICS_DAYS_BACK, ANALYTICS_DAYS_LONG, CRAWL_TOP_PAGES, TRENDS_GEO, TRENDS_LIMIT,
+    TOKEN_BATCH_CHARS, TOKEN_BATCH_INTERVAL,
+)
 import seo_potential as seo_potential_module
 
 load_dotenv()
 
-_HISTORY_FILE = Path(__file__).parent / "data" / "ideas_history.json"
+_HISTORY_FILE = Path(__file__).parent / "data" / "ideas_history.jsonl"
+_LEGACY_HISTORY_FILE = _HISTORY_FILE.with_suffix(".json")
+_HISTORY_KEEP = 30           # runs kept in the history
+_HISTORY_COMPACT_EVERY = 10  # appends between two compactions (per process)
 
+# Serialises append + compaction across Streamlit sessions (they share this process)
+_history_lock = threading.Lock()
+# Start "due" so the first save of a process trims whatever earlier processes left
+_appends_since_compaction = _HISTORY_COMPACT_EVERY
 
-@dataclass
+_FETCH_TIMEOUT = 45  # seconds, for all data sources together
+
+_trends_refresh_lock = threading.Lock()
+
+
+@dataclass(slots=True)
 class PipelineResult:
     ideas: list[dict] = field(default_factory=list)
     analyst_output: str = ""
@@ -64,41 +88,185 @@ class PipelineResult:
     fetched_at: datetime | None = None
 
 
+@lru_cache(maxsize=4)
+def _get_openai_client(api_key: str) -> OpenAI:
+    # Cached: the httpx connection pool (DNS, TLS, keep-alive) survives between runs
+    return OpenAI(api_key=api_key)
+
+
+def _refresh_trends_in_background(fetch) -> None:
+    """Fill the Trends cache for the next run; at most one refresh at a time."""
+    if not _trends_refresh_lock.acquire(blocking=False):
+        return  # A refresh is already running (pytrends rate-limits quickly)
+
+    def worker():
+        try:
+            fetch()
+        finally:
+            _trends_refresh_lock.release()
+
+    threading.Thread(target=worker, name="trends-refresh", daemon=True).start()
+
+
+def _write_history_lines(lines: list[bytes]) -> None:
+    """Atomically replace the history file with the given JSON lines."""
+    fd, tmp = tempfile.mkstemp(dir=_HISTORY_FILE.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.writelines(lines)
+    os.replace(tmp, _HISTORY_FILE)
+
+
+def _migrate_legacy_history() -> None:
+    """Convert the old ideas_history.json array into the JSON-Lines file once."""
+    if _HISTORY_FILE.exists() or not _LEGACY_HISTORY_FILE.exists():
+        return
+    try:
+        history = orjson.loads(_LEGACY_HISTORY_FILE.read_bytes())
+        _write_history_lines([
+            orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+            for entry in history[-_HISTORY_KEEP:]
+        ])
+        _LEGACY_HISTORY_FILE.unlink()
+    except Exception:
+        pass  # Unreadable legacy file → start a fresh history
+
+
+def _append_history_line(line: bytes) -> None:
+    """Append one entry; only the file's last byte is read, never the whole file."""
+    with _HISTORY_FILE.open("ab+") as f:
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                line = b"\n" + line  # an interrupted write left a partial line
+        f.write(line)
+
+
+def _compact_history_if_due() -> None:
+    """Trim the file to the last 30 runs once every _HISTORY_COMPACT_EVERY appends."""
+    global _appends_since_compaction
+    _appends_since_compaction += 1
+    if _appends_since_compaction < _HISTORY_COMPACT_EVERY:
+        return
+    _appends_since_compaction = 0
+    with _HISTORY_FILE.open("rb") as f:
+        lines = f.readlines()
+    if len(lines) > _HISTORY_KEEP:
+        _write_history_lines(lines[-_HISTORY_KEEP:])
+
+
 def _save_ideas_history(ideas: list[dict]) -> None:
-    """Append the generated ideas to the local JSON history file."""
+    """Append the generated ideas to the local JSON-Lines history file."""
     try:
         _HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-        history: list[dict] = []
-        if _HISTORY_FILE.exists():
-            try:
-                history = json.loads(_HISTORY_FILE.read_text(encoding="utf-8"))
-            except Exception:
-                history = []
+        _migrate_legacy_history()
         entry = {
             "generated_at": datetime.now().isoformat(),
             "ideas": ideas,
         }
-        history.append(entry)
-        # Keep last 30 runs
-        history = history[-30:]
-        _HISTORY_FILE.write_text(
-            json.dumps(history, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        with _history_lock:
+            _append_history_line(line)
+            _compact_history_if_due()
     except Exception:
         pass  # History is non-critical
 
 
 def load_ideas_history() -> list[dict]:
     """Load persisted idea runs. Returns list of {generated_at, ideas} dicts."""
+    _migrate_legacy_history()
     if not _HISTORY_FILE.exists():
         return []
+    history: list[dict] = []
     try:
-        return json.loads(_HISTORY_FILE.read_text(encoding="utf-8"))
+        with _HISTORY_FILE.open("rb") as f:
+            for line in collections.deque(f, maxlen=_HISTORY_KEEP):
+                try:
+                    history.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    pass  # Skip a line torn by an interrupted write
     except Exception:
         return []
+    return history
+
+
+def _iter_fetches(jobs: list[tuple[str, object]], timeout: float) -> Iterator[tuple[str, object]]:
+    """
+    Run blocking fetch functions concurrently and yield (label, data or exception)
+    in completion order, so callers can act on each source as soon as it lands.
+
+    Fetches still running after `timeout` seconds are yielded as TimeoutError
+    and abandoned — the caller does not wait for them.
+    """
+    # Own executor: the Google SDKs and pytrends are sync-only
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(jobs))
+    futures = {executor.submit(fetch): label for label, fetch in jobs}
+    pending = set(futures)
+    try:
+        for future in concurrent.futures.as_completed(futures, timeout=timeout):
+            pending.discard(future)
+            yield futures[future], future.exception() or future.result()
+    except concurrent.futures.TimeoutError:
+        for future in pending:
+            yield futures[future], TimeoutError(f"keine Antwort nach {timeout}s")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _batch_tokens(callback):
+    """
+    Wrap a token_callback(accumulated_text) so it fires at most every
+    TOKEN_BATCH_CHARS new characters or TOKEN_BATCH_INTERVAL seconds.
+
+    Returns (batched_callback, flush); flush() delivers a held-back final text.
+    """
+    sent_len = 0
+    last_sent = 0.0
+    pending = None
+
+    def batched(text: str):
+        nonlocal sent_len, last_sent, pending
+        now = time.monotonic()
+        if len(text) - sent_len >= TOKEN_BATCH_CHARS or now - last_sent >= TOKEN_BATCH_INTERVAL:
+            callback(text)
+            sent_len, last_sent, pending = len(text), now, None
+        else:
+            pending = text
+
+    def flush():
+        nonlocal pending
+        if pending is not None:
+            callback(pending)
+            pending = None
+
+    return batched, flush
 
 
-def run(status_callback=None, token_callback=None) -> PipelineResult:
+class _Cancelled(Exception):
+    """Raised inside the pipeline thread once the stream() consumer has gone away."""
+
+
+def _run_streaming(agent_run, token_sink, cancelled: threading.Event, *args, **kwargs):
+    """
+    Run a streaming agent with batched token updates to `token_sink`.
+
+    Raising from the token callback aborts the OpenAI stream, so a cancelled
+    run stops generating at the next token instead of finishing the reply.
+    """
+    batched, flush = _batch_tokens(token_sink)
+
+    def on_token(text: str):
+        if cancelled.is_set():
+            raise _Cancelled()
+        batched(text)
+
+    try:
+        return agent_run(*args, token_callback=on_token, **kwargs)
+    finally:
+        if not cancelled.is_set():
+            flush()
+
+
+def run(status_callback=None, token_callback=None, force_refresh: bool = False) -> PipelineResult:
     """
     Execute the full multi-agent content idea pipeline.
 
@@ -107,18 +275,110 @@ def run(status_callback=None, token_callback=None) -> PipelineResult:
 
     token_callback(phase: str, accumulated_text: str) is called on each
     streaming token for text-generating agents.
+
+    force_refresh=True bypasses the on-disk data cache (data/cache.py) and
+    fetches GA4, GSC, RSS and Trends fresh.
+
+    Blocking wrapper around stream(); the callbacks run on the calling thread.
+    A callback that raises is logged and disabled — the agents keep running.
     """
+    for event in stream(force_refresh=force_refresh):
+        if event["event"] == "status":
+            if status_callback:
+                try:
+                    status_callback(event["message"])
+                except Exception as e:
+                    print(f"[pipeline] status_callback Fehler: {e}")
+                    status_callback = None
+        elif event["event"] == "token":
+            if token_callback:
+                try:
+                    token_callback(event["phase"], event["text"])
+                except Exception as e:
+                    print(f"[pipeline] token_callback Fehler: {e}")
+                    token_callback = None
+        else:
+            return event["result"]
+
+
+def stream(force_refresh: bool = False) -> Iterator[dict]:
+    """
+    Run the pipeline in a background thread and yield its progress as events:
+
+      {"event": "status", "message": str}
+      {"event": "token", "phase": str, "text": str}   # accumulated agent output
+      {"event": "result", "result": PipelineResult}   # always the last event
+
+    The consumer renders each event as it arrives (no callbacks needed). If it
+    falls behind, queued token events of the same phase are collapsed to the
+    newest one, since each carries the full accumulated text.
+
+    Closing the generator early (e.g. a Streamlit rerun or stop) cancels the
+    run: no further phases start and streaming agents stop at the next token.
+    """
+    events: queue.SimpleQueue = queue.SimpleQueue()
+    cancelled = threading.Event()
+
+    def worker():
+        result = PipelineResult()
+        try:
+            _execute(result, events.put, force_refresh, cancelled)
+        except _Cancelled:
+            print("[pipeline] Run abgebrochen (Konsument nicht mehr verbunden)")
+            return
+        except Exception as e:
+            result.errors.append(f"Pipeline-Fehler: {e}")
+        events.put({"event": "result", "result": result})
+
+    threading.Thread(target=worker, name="pipeline", daemon=True).start()
+    try:
+        yield from _coalesced(events)
+    finally:
+        # Also runs on GeneratorExit, i.e. when the consumer abandons the stream
+        cancelled.set()
+
+
+def _coalesced(events: queue.SimpleQueue) -> Iterator[dict]:
+    """Yield queued pipeline events up to the result, skipping superseded tokens."""
+    while True:
+        pending = [events.get()]
+        while True:
+            try:
+                pending.append(events.get_nowait())
+            except queue.Empty:
+                break
+        for event, following in zip(pending, pending[1:] + [None]):
+            if (
+                event["event"] == "token"
+                and following is not None
+                and following["event"] == "token"
+                and following["phase"] == event["phase"]
+            ):
+                continue  # superseded by the next update of the same phase
+            yield event
+            if event["event"] == "result":
+                return
+
+
+def _execute(
+    result: PipelineResult, emit, force_refresh: bool, cancelled: threading.Event
+) -> None:
+    """Pipeline body: fills `result` and reports progress via emit(event)."""
+
+    def check_cancelled():
+        if cancelled.is_set():
+            raise _Cancelled()
 
     def status(msg: str):
-        if status_callback:
-            status_callback(msg)
+        # Every status marks a phase boundary — don't start a phase nobody will see
+        check_cancelled()
+        emit({"event": "status", "message": msg})
 
-    def make_token_cb(phase: str):
-        if token_callback:
-            return lambda text: token_callback(phase, text)
-        return None
+    def token_callback(phase: str, text: str):
+        emit({"event": "token", "phase": phase, "text": text})
 
-    result = PipelineResult()
+    def make_token_cb(phase: str):
+        return lambda text: token_callback(phase, text)
 
     # --- Config from env ---
     api_key = os.getenv("OPENAI_API_KEY")
@@ -128,9 +388,9 @@ def run(status_callback=None, token_callback=None) -> PipelineResult:
 
     if not api_key:
         result.errors.append("OPENAI_API_KEY fehlt in der .env-Datei.")
-        return result
+        return
 
-    client = OpenAI(api_key=api_key)
+    client = _get_openai_client(api_key)
 
     has_credentials = (
         os.path.exists(credentials_file)
@@ -141,150 +401,188 @@ def run(status_callback=None, token_callback=None) -> PipelineResult:
     # --- Step 1: Fetch all data sources in parallel ---
     status("Daten werden geladen (GA4, Search Console, RSS)...")
 
-    ga4_pages: list[dict] = []
-    gsc_queries: list[dict] = []
-    rss_articles: list[dict] = []
-    gsc_pages: list[dict] = []
-    ga4_pages_long: list[dict] = []
-    gsc_queries_long: list[dict] = []
-    trends_data: list[dict] = []
-
     def fetch_ga4():
+        # 7-day and 90-day reports in one batchRunReports round-trip
         if not property_id or not has_credentials:
-            return []
-        return fetch_top_pages(property_id, credentials_file, days_back=ANALYTICS_DAYS_BACK)
-
-    def fetch_ga4_long():
-        if not property_id or not has_credentials:
-            return []
-        return fetch_top_pages(property_id, credentials_file, days_back=ANALYTICS_DAYS_LONG)
+            return [], []
+        return fetch_top_pages_batch(
+            property_id, credentials_file,
+            days_back_list=[ANALYTICS_DAYS_BACK, ANALYTICS_DAYS_LONG],
+            force_refresh=force_refresh,
+        )
 
     def fetch_gsc():
         if not site_url or not has_credentials:
             return []
-        return fetch_top_queries(site_url, credentials_file, days_back=ANALYTICS_DAYS_BACK)
+        return fetch_top_queries(
+            site_url, credentials_file, days_back=ANALYTICS_DAYS_BACK,
+            force_refresh=force_refresh,
+        )
 
     def fetch_gsc_long():
         if not site_url or not has_credentials:
             return []
-        return fetch_top_queries(site_url, credentials_file, days_back=ANALYTICS_DAYS_LONG)
+        return fetch_top_queries(
+            site_url, credentials_file, days_back=ANALYTICS_DAYS_LONG,
+            force_refresh=force_refresh,
+        )
 
     def fetch_gsc_pages():
         if not site_url or not has_credentials:
             return []
         return fetch_top_pages_by_position(
-            site_url, credentials_file, days_back=ANALYTICS_DAYS_BACK, limit=25
+            site_url, credentials_file, days_back=ANALYTICS_DAYS_BACK, limit=25,
+            force_refresh=force_refresh,
         )
 
     def fetch_rss():
-        return fetch_rss_articles()
+        return fetch_rss_articles(force_refresh=force_refresh)
 
     def fetch_trends():
-        return fetch_trending_topics(geo=TRENDS_GEO, limit=TRENDS_LIMIT)
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=7) as executor:
-        future_ga4 = executor.submit(fetch_ga4)
-        future_ga4_long = executor.submit(fetch_ga4_long)
-        future_gsc = executor.submit(fetch_gsc)
-        future_gsc_long = executor.submit(fetch_gsc_long)
-        future_gsc_pages = executor.submit(fetch_gsc_pages)
-        future_rss = executor.submit(fetch_rss)
-        future_trends = executor.submit(fetch_trends)
-
-        deadline = time.monotonic() + 45  # extended timeout for 7 fetches
-        fetch_map = [
-            (future_ga4, "GA4"),
-            (future_ga4_long, "GA4-90T"),
-            (future_gsc, "GSC"),
-            (future_gsc_long, "GSC-90T"),
-            (future_gsc_pages, "GSC-Pages"),
-            (future_rss, "RSS"),
-            (future_trends, "Trends"),
-        ]
-        for future, label in fetch_map:
-            remaining = max(0.1, deadline - time.monotonic())
+        return fetch_trending_topics(
+            geo=TRENDS_GEO, limit=TRENDS_LIMIT, force_refresh=force_refresh
+        )
+
+    # label → (PipelineResult fields, fetch); GA4 fills both periods from one call
+    fetches = {
+        "GA4": (("ga4_pages", "ga4_pages_long"), fetch_ga4),
+        "GSC": (("gsc_queries",), fetch_gsc),
+        "GSC-90T": (("gsc_queries_long",), fetch_gsc_long),
+        "GSC-Pages": (("gsc_pages",), fetch_gsc_pages),
+        "RSS": (("rss_articles",), fetch_rss),
+        "Trends": (("trends_data",), fetch_trends),
+    }
+
+    # Google Trends is the slowest source and changes over hours: serve a fresh
+    # cache entry right away, and on a miss refill the cache in the background
+    # for the next run instead of making the Analyst wait. Only an explicit
+    # force_refresh waits for live Trends data.
+    if not force_refresh:
+        del fetches["Trends"]
+        cached_trends = fetch_trending_topics.cached(geo=TRENDS_GEO, limit=TRENDS_LIMIT)
+        if cached_trends is not None:
+            result.trends_data = cached_trends
+        else:
+            _refresh_trends_in_background(fetch_trends)
+            result.errors.append(
+                "Trends-Hinweis: kein aktueller Cache, Daten werden im Hintergrund "
+                "geladen – diese Analyse läuft ohne Trends."
+            )
+
+    # Token updates of the parallel agents are queued and forwarded one phase at
+    # a time (Analyst first), so the single live view never interleaves streams.
+    token_events: queue.SimpleQueue = queue.SimpleQueue()
+    latest_text: dict[str, str] = {}
+
+    def queued_token_cb(phase: str):
+        return lambda text: token_events.put((phase, text))
+
+    def relay_tokens(future, phase: str):
+        def forward(event_phase: str, text: str):
+            latest_text[event_phase] = text
+            if event_phase == phase:
+                token_callback(event_phase, text)
+
+        if phase in latest_text:
+            token_callback(phase, latest_text[phase])
+        while not future.done():
             try:
-                data = future.result(timeout=remaining)
-                if label == "GA4":
-                    ga4_pages = data
-                elif label == "GA4-90T":
-                    ga4_pages_long = data
-                elif label == "GSC":
-                    gsc_queries = data
-                elif label == "GSC-90T":
-                    gsc_queries_long = data
-                elif label == "GSC-Pages":
-                    gsc_pages = data
-                elif label == "RSS":
-                    rss_articles = data
-                else:
-                    trends_data = data
+                forward(*token_events.get(timeout=0.05))
+            except queue.Empty:
+                pass
+        for _ in range(token_events.qsize()):
+            forward(*token_events.get_nowait())
+
+    # Dataflow instead of a barrier: the crawler starts once GA4 has landed, the
+    # Trend Scout once RSS has landed and the Analyst once all of its sources
+    # have landed, while slower fetches are still running.
+    analyst_sources = {"GA4", "GSC", "GSC-90T", "GSC-Pages", "Trends"} & fetches.keys()
+    landed: set[str] = set()
+    future_crawl = future_analyst = future_trend_scout = None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        for label, data in _iter_fetches(
+            [(label, fetch) for label, (_, fetch) in fetches.items()],
+            timeout=_FETCH_TIMEOUT,
+        ):
+            check_cancelled()
+            landed.add(label)
+            fields = fetches[label][0]
+            if isinstance(data, Exception):
+                result.errors.append(f"{label}-Fehler: {data}")
+            else:
+                for name, value in zip(fields, data if len(fields) > 1 else (data,)):
+                    setattr(result, name, value)
+
+            # --- Step 2: Crawl top pages for existing-content context ---
+            if label == "GA4" and result.ga4_pages and site_url:
+                future_crawl = executor.submit(
+                    crawl_top_pages,
+                    result.ga4_pages, base_url=site_url, limit=CRAWL_TOP_PAGES,
+                )
+            # --- Step 3: Agent 2 – Trend Scout ---
+            if label == "RSS":
+                future_trend_scout = executor.submit(
+                    _run_streaming,
+                    trend_scout_agent.run, queued_token_cb("trend_scout"), cancelled,
+                    client, result.rss_articles,
+                )
+            # --- Step 4: Agent 1 – Analyst ---
+            if future_analyst is None and analyst_sources <= landed:
+                future_analyst = executor.submit(
+                    _run_streaming,
+                    analyst_agent.run, queued_token_cb("analyst"), cancelled,
+                    client, result.ga4_pages, result.gsc_queries,
+                    gsc_pages=result.gsc_pages,
+                    ga4_pages_long=result.ga4_pages_long,
+                    gsc_queries_long=result.gsc_queries_long,
+                    trends_data=result.trends_data,
+                )
+
+        result.fetched_at = datetime.now()
+
+        # --- Calculate SEO traffic potential (needs GSC data) ---
+        if result.gsc_pages or result.gsc_queries:
+            try:
+                result.seo_potential = seo_potential_module.calculate_seo_potential(
+                    result.gsc_pages, result.gsc_queries
+                )
             except Exception as e:
-                result.errors.append(f"{label}-Fehler: {e}")
-
-    result.ga4_pages = ga4_pages
-    result.gsc_queries = gsc_queries
-    result.rss_articles = rss_articles
-    result.gsc_pages = gsc_pages
-    result.ga4_pages_long = ga4_pages_long
-    result.gsc_queries_long = gsc_queries_long
-    result.trends_data = trends_data
-    result.fetched_at = datetime.now()
-
-    # --- Calculate SEO traffic potential ---
-    try:
-        result.seo_potential = seo_potential_module.calculate_seo_potential(
-            gsc_pages, gsc_queries
-        )
-    except Exception as e:
-        result.errors.append(f"SEO-Potenzial-Fehler: {e}")
+                result.errors.append(f"SEO-Potenzial-Fehler: {e}")
 
-    # --- Step 2: Crawl top pages for existing-content context ---
-    status("Bestehende Top-Seiten werden analysiert (Website-Crawler)...")
-    crawled_pages: list[dict] = []
-    if ga4_pages and site_url:
+        status("Bestehende Top-Seiten werden analysiert (Website-Crawler)...")
+        crawled_pages: list[dict] = []
+        if future_crawl:
+            try:
+                crawled_pages = future_crawl.result()
+            except Exception as e:
+                result.errors.append(f"Crawler-Fehler: {e}")
+        result.crawled_pages = crawled_pages
+
+        status("Agent 1/4: Analyst wertet GA4 & Search Console aus...")
+        relay_tokens(future_analyst, "analyst")
         try:
-            crawled_pages = crawl_top_pages(
-                ga4_pages, base_url=site_url, limit=CRAWL_TOP_PAGES
-            )
+            result.analyst_output = future_analyst.result()
         except Exception as e:
-            result.errors.append(f"Crawler-Fehler: {e}")
-    result.crawled_pages = crawled_pages
-
-    # --- Step 3: Agent 1 – Analyst ---
-    status("Agent 1/4: Analyst wertet GA4 & Search Console aus...")
-    try:
-        result.analyst_output = analyst_agent.run(
-            client, ga4_pages, gsc_queries,
-            gsc_pages=gsc_pages,
-            ga4_pages_long=ga4_pages_long,
-            gsc_queries_long=gsc_queries_long,
-            trends_data=trends_data,
-            token_callback=make_token_cb("analyst"),
-        )
-    except Exception as e:
-        result.errors.append(f"Analyst-Agent Fehler: {e}")
-        result.analyst_output = "Keine Analyse verfügbar."
+            result.errors.append(f"Analyst-Agent Fehler: {e}")
+            result.analyst_output = "Keine Analyse verfügbar."
 
-    # --- Step 4: Agent 2 – Trend Scout ---
-    status("Agent 2/4: Trend-Scout analysiert RSS-Feeds...")
-    try:
-        result.trend_scout_output = trend_scout_agent.run(
-            client, rss_articles,
-            token_callback=make_token_cb("trend_scout"),
-        )
-    except Exception as e:
-        result.errors.append(f"Trend-Scout-Agent Fehler: {e}")
-        result.trend_scout_output = "Keine Trend-Analyse verfügbar."
+        status("Agent 2/4: Trend-Scout analysiert RSS-Feeds...")
+        relay_tokens(future_trend_scout, "trend_scout")
+        try:
+            result.trend_scout_output = future_trend_scout.result()
+        except Exception as e:
+            result.errors.append(f"Trend-Scout-Agent Fehler: {e}")
+            result.trend_scout_output = "Keine Trend-Analyse verfügbar."
 
     # --- Step 5: Agent 3 – Strategist ---
     status("Agent 3/4: Stratege kombiniert Erkenntnisse zu Ideen...")
     try:
         crawl_summaries = format_crawl_summaries(crawled_pages)
-        result.strategist_output = strategist_agent.run(
+        result.strategist_output = _run_streaming(
+            strategist_agent.run, make_token_cb("strategist"), cancelled,
             client, result.analyst_output, result.trend_scout_output,
             crawl_summaries=crawl_summaries,
-            token_callback=make_token_cb("strategist"),
         )
     except Exception as e:
         result.errors.append(f"Strategen-Agent Fehler: {e}")
@@ -293,7 +591,7 @@ def run(status_callback=None, token_callback=None) -> PipelineResult:
     # --- Step 6: Agent 4 – Editor ---
     status("Agent 4/4: Redakteur verfeinert Titel & Begründungen...")
     try:
-        result.ideas = editor_agent.run(client, result.strategist_output, rss_articles)
+        result.ideas = editor_agent.run(client, result.strategist_output, result.rss_articles)
     except Exception as e:
         result.errors.append(f"Redakteur-Agent Fehler: {e}")
 
@@ -302,4 +600,3 @@ def run(status_callback=None, token_callback=None) -> PipelineResult:
         _save_ideas_history(result.ideas)
 
     status("Fertig!")
-    return result
@@ -7,6 +7,9 @@ Computes estimated monthly traffic gains from:
 
 from __future__ import annotations
 
+import bisect
+import heapq
+
 CTR_BENCHMARKS = {
     1: 0.278, 2: 0.158, 3: 0.110, 4: 0.079, 5: 0.058,
     6: 0.043, 7: 0.033, 8: 0.026, 9: 0.020, 10: 0.016,
@@ -15,23 +18,43 @@ CTR_BENCHMARKS = {
 
 MAX_TOTAL_POTENTIAL = 5000  # cap at plausible upper bound
 
+FAST_RANKER_TARGET_CTR = CTR_BENCHMARKS[3]  # target: position 3
+WEEK_TO_MONTH = 30 / 7  # GSC data covers 7 days
 
-def _get_ctr_for_position(pos: float) -> float:
+
+_CTR_POSITIONS = sorted(CTR_BENCHMARKS)
+
+
+def _interpolate_ctr(pos: float) -> float:
     """Interpolate CTR for a given position using benchmark table."""
-    positions = sorted(CTR_BENCHMARKS.keys())
+    positions = _CTR_POSITIONS
     if pos <= positions[0]:
         return CTR_BENCHMARKS[positions[0]]
     if pos >= positions[-1]:
         return CTR_BENCHMARKS[positions[-1]]
     # Find surrounding positions for linear interpolation
-    lower = max(p for p in positions if p <= pos)
-    upper = min(p for p in positions if p >= pos)
-    if lower == upper:
-        return CTR_BENCHMARKS[lower]
+    i = bisect.bisect_left(positions, pos)
+    upper = positions[i]
+    if upper == pos:
+        return CTR_BENCHMARKS[upper]
+    lower = positions[i - 1]
     frac = (pos - lower) / (upper - lower)
     return CTR_BENCHMARKS[lower] + frac * (CTR_BENCHMARKS[upper] - CTR_BENCHMARKS[lower])
 
 
+# CTR for positions 0.0, 0.1, … 20.0 — index = position * 10
+_CTR_LUT = [_interpolate_ctr(i / 10) for i in range(_CTR_POSITIONS[-1] * 10 + 1)]
+
+
+def _get_ctr_for_position(pos: float) -> float:
+    """CTR for a position; GSC positions (rounded to 0.1) come from the lookup table."""
+    # round(), not int(): 7.3 * 10 == 72.99999999999999
+    idx = round(pos * 10)
+    if 0 <= idx < len(_CTR_LUT) and abs(pos * 10 - idx) < 1e-9:
+        return _CTR_LUT[idx]
+    return _interpolate_ctr(pos)
+
+
 def calculate_seo_potential(gsc_pages: list[dict], gsc_queries: list[dict]) -> dict:
     """
     Calculate monthly traffic potential from GSC data.
@@ -44,7 +67,16 @@ def calculate_seo_potential(gsc_pages: list[dict], gsc_queries: list[dict]) -> d
         "top_opportunities": list[dict], # top 5 pages/queries with potential & delta
       }
     """
+    if not gsc_pages and not gsc_queries:
+        return {
+            "fast_ranker_potential": 0,
+            "ctr_gap_potential": 0,
+            "total_potential": 0,
+            "top_opportunities": [],
+        }
+
     opportunities: list[dict] = []
+    ctr_for_position = _get_ctr_for_position
 
     # --- Fast-Rankers: pages pos 4-15 ---
     fast_ranker_total = 0
@@ -53,13 +85,11 @@ def calculate_seo_potential(gsc_pages: list[dict], gsc_queries: list[dict]) -> d
         impressions = int(page.get("impressions", 0))
         if not (4 <= pos <= 15) or impressions == 0:
             continue
-        ctr_current = _get_ctr_for_position(pos)
-        ctr_target = CTR_BENCHMARKS[3]  # target: position 3
-        delta_ctr = ctr_target - ctr_current
+        delta_ctr = FAST_RANKER_TARGET_CTR - ctr_for_position(pos)
         if delta_ctr <= 0:
             continue
         # Scale from 7-day impressions to monthly
-        monthly_delta = int(impressions * delta_ctr * (30 / 7))
+        monthly_delta = int(impressions * delta_ctr * WEEK_TO_MONTH)
         if monthly_delta <= 0:
             continue
         fast_ranker_total += monthly_delta
@@ -81,14 +111,12 @@ def calculate_seo_potential(gsc_pages: list[dict], gsc_queries: list[dict]) -> d
         pos = float(query.get("position", 0))
         impressions = int(query.get("impressions", 0))
         ctr_pct = float(query.get("ctr", 0))
-        ctr_frac = ctr_pct / 100
         if pos >= 20 or impressions == 0 or ctr_pct >= 3.0:
             continue
-        ctr_expected = _get_ctr_for_position(pos)
-        delta_ctr = ctr_expected - ctr_frac
+        delta_ctr = ctr_for_position(pos) - ctr_pct / 100
         if delta_ctr <= 0:
             continue
-        monthly_delta = int(impressions * delta_ctr * (30 / 7))
+        monthly_delta = int(impressions * delta_ctr * WEEK_TO_MONTH)
         if monthly_delta <= 0:
             continue
         ctr_gap_total += monthly_delta
@@ -102,9 +130,8 @@ def calculate_seo_potential(gsc_pages: list[dict], gsc_queries: list[dict]) -> d
             "monthly_delta": monthly_delta,
         })
 
-    # Sort by potential, take top 5
-    opportunities.sort(key=lambda x: x["monthly_delta"], reverse=True)
-    top_opportunities = opportunities[:5]
+    # Top 5 by potential (same order as a stable sort, without sorting everything)
+    top_opportunities = heapq.nlargest(5, opportunities, key=lambda x: x["monthly_delta"])
 
     total_potential = min(fast_ranker_total + ctr_gap_total, MAX_TOTAL_POTENTIAL)
 
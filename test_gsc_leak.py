@@ -66,6 +66,10 @@ LEAK_PATTERNS = [
     r"[\d,\.]+\s*%\s*CTR",
 ]
 
+# Einmal kompiliert; jedes Pattern wird separat geprüft, damit überlappende Treffer
+# (z.B. "CTR 7,0 %") für alle passenden Pattern gemeldet werden
+_LEAK_RES = tuple(re.compile(p, re.IGNORECASE) for p in LEAK_PATTERNS)
+
 
 def check_article_for_leaks(article: dict) -> list[str]:
     """Prüft title, lead und alle sections auf GSC-Metrik-Leaks."""
@@ -79,9 +83,9 @@ def check_article_for_leaks(article: dict) -> list[str]:
         fields_to_check.append((f"sections[{i}].content", sec.get("content", "")))
 
     for field_name, text in fields_to_check:
-        for pattern in LEAK_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                leaks.append(f"  LEAK in '{field_name}': Pattern '{pattern}' gefunden")
+        for leak_re in _LEAK_RES:
+            if leak_re.search(text):
+                leaks.append(f"  LEAK in '{field_name}': Pattern '{leak_re.pattern}' gefunden")
                 leaks.append(f"    → {text[:200]}")
 
     return leaks